@@ -2,9 +2,38 @@
 Setup configuration for finance package.
 
 Installs under the aletrader.finance namespace.
+
+Set ALETRADER_FINANCE_MYPYC=1 to compile the hot accounting domain modules
+with mypyc. Without the flag, or when mypyc is unavailable, the package
+installs as pure Python.
 """
 
-from setuptools import setup, find_packages
+import os
+
+from setuptools import Extension, setup, find_packages
+
+
+MYPYC_ENV_FLAG = "ALETRADER_FINANCE_MYPYC"
+
+MYPYC_OPTIONS = ["--follow-imports=silent"]
+
+MYPYC_MODULES = [
+    "src/aletrader/finance/accounting/domain/calculations.py",
+    "src/aletrader/finance/accounting/domain/aggregations.py",
+    "src/aletrader/finance/accounting/domain/position_calculations.py",
+    "src/aletrader/finance/accounting/domain/transactions.py",
+]
+
+
+def _compiled_extensions() -> list[Extension]:
+    """Return mypyc extensions when compilation is requested and available."""
+    if os.environ.get(MYPYC_ENV_FLAG) != "1":
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        return []
+    return mypycify(MYPYC_OPTIONS + MYPYC_MODULES)
 
 
 setup(
@@ -13,4 +42,5 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.11",
+    ext_modules=_compiled_extensions(),
 )
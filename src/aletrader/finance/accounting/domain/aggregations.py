@@ -2,15 +2,21 @@
 Aggregation helpers for accounting summaries.
 """
 
+from collections import deque
 from decimal import Decimal
 from typing import Sequence
 
+from aletrader.finance.accounting.domain.calculations import to_decimal
 from aletrader.finance.accounting.interfaces import (
     ApprovedOrderLike,
     LedgerTransactionLike,
     PositionStateLike,
+    TradeHistoryTransactionLike,
 )
 
+_ZERO = Decimal("0")
+_DEFAULT_FX = Decimal("1.0")
+
 
 def _ensure_sequence(value: Sequence[object], name: str) -> None:
     """Validate that a value is a non-None sequence."""
@@ -28,12 +34,15 @@ def aggregate_unrealized_pnl(
         positions: List of position states
 
     Returns:
-        Total unrealized P&L
+        Total unrealized P&L (flat positions are skipped)
     """
     _ensure_sequence(positions, "positions")
-    total = Decimal("0")
+    if not positions:
+        return _ZERO
+    total = _ZERO
     for pos in positions:
-        total += pos.unrealized_pnl
+        if pos.qty:
+            total += pos.unrealized_pnl
     return total
 
 
@@ -47,12 +56,15 @@ def aggregate_positions_value(
         positions: List of position states
 
     Returns:
-        Total positions value (sum of notional values)
+        Total positions value (sum of notional values, flat positions skipped)
     """
     _ensure_sequence(positions, "positions")
-    total = Decimal("0")
+    if not positions:
+        return _ZERO
+    total = _ZERO
     for pos in positions:
-        total += pos.notional
+        if pos.qty:
+            total += pos.notional
     return total
 
 
@@ -65,9 +77,13 @@ def aggregate_positions_cost(
     Formula: sum(qty * avg_cost) for all positions.
     """
     _ensure_sequence(positions, "positions")
-    total = Decimal("0")
+    if not positions:
+        return _ZERO
+    total = _ZERO
     for pos in positions:
-        total += pos.qty * pos.avg_cost
+        qty = pos.qty
+        if qty:
+            total += qty * pos.avg_cost
     return total
 
 
@@ -84,13 +100,17 @@ def aggregate_order_risk(
         Tuple of (total_risk, total_quantity)
     """
     _ensure_sequence(orders, "orders")
-    total_risk = Decimal("0")
-    total_quantity = Decimal("0")
+    if not orders:
+        return (_ZERO, _ZERO)
+    total_risk = _ZERO
+    total_quantity = _ZERO
     for order in orders:
-        if order.risk_amount:
-            total_risk += Decimal(str(order.risk_amount))
-        if order.final_quantity > 0:
-            total_quantity += Decimal(str(order.final_quantity))
+        risk_amount = order.risk_amount
+        final_quantity = order.final_quantity
+        if risk_amount:
+            total_risk += to_decimal(risk_amount)
+        if final_quantity > 0:
+            total_quantity += to_decimal(final_quantity)
     return (total_risk, total_quantity)
 
 
@@ -110,21 +130,20 @@ def aggregate_strategy_metrics(
     strategies: dict[str, dict[str, int | Decimal]] = {}
     for order in orders:
         strategy_id = order.strategy_id
-        if strategy_id not in strategies:
-            strategies[strategy_id] = {
+        metrics = strategies.get(strategy_id)
+        if metrics is None:
+            metrics = strategies[strategy_id] = {
                 "count": 0,
-                "risk": Decimal("0"),
-                "quantity": Decimal("0"),
+                "risk": _ZERO,
+                "quantity": _ZERO,
             }
-        strategies[strategy_id]["count"] = int(strategies[strategy_id]["count"]) + 1
-        if order.risk_amount is not None:
-            strategies[strategy_id]["risk"] = (
-                strategies[strategy_id]["risk"] + Decimal(str(order.risk_amount))
-            )
-        if order.final_quantity and order.final_quantity > 0:
-            strategies[strategy_id]["quantity"] = (
-                strategies[strategy_id]["quantity"] + Decimal(str(order.final_quantity))
-            )
+        metrics["count"] = int(metrics["count"]) + 1
+        risk_amount = order.risk_amount
+        if risk_amount is not None:
+            metrics["risk"] = metrics["risk"] + to_decimal(risk_amount)
+        final_quantity = order.final_quantity
+        if final_quantity and final_quantity > 0:
+            metrics["quantity"] = metrics["quantity"] + to_decimal(final_quantity)
     return strategies
 
 
@@ -141,15 +160,43 @@ def calculate_average_metrics(
         Average value, or None if all values are None
     """
     _ensure_sequence(values, "values")
-    filtered = [value for value in values if value is not None]
-    if not filtered:
+    total = _ZERO
+    count = 0
+    for value in values:
+        if value is not None:
+            total += to_decimal(value)
+            count += 1
+    if not count:
         return None
-    total = sum(Decimal(str(value)) for value in filtered)
-    return total / Decimal(len(filtered))
+    return total / Decimal(count)
 
 
-def calculate_realized_pnl_from_transaction_history(
+def calculate_realized_pnl_from_exit_transactions(
     transactions: Sequence[LedgerTransactionLike],
+) -> Decimal:
+    """
+    Sum stored realized P&L over exit (SELL) transactions.
+
+    Args:
+        transactions: Ledger transactions with side and realized_pnl_delta
+
+    Returns:
+        Total realized P&L (missing deltas count as zero)
+    """
+    _ensure_sequence(transactions, "transactions")
+    if not transactions:
+        return _ZERO
+    total = _ZERO
+    for tx in transactions:
+        if tx.side == "SELL":
+            delta = tx.realized_pnl_delta
+            if delta is not None:
+                total += to_decimal(delta)
+    return total
+
+
+def calculate_realized_pnl_from_transaction_history(
+    transactions: Sequence[TradeHistoryTransactionLike],
 ) -> Decimal:
     """
     Calculate cumulative realized P&L from transaction history using FIFO cost basis.
@@ -167,7 +214,8 @@ def calculate_realized_pnl_from_transaction_history(
 
     Args:
         transactions: All ledger transactions (must have symbol, side, type, qty, price, 
-                     commission, fees, taxes, fx attributes)
+                     commission, fees, taxes attributes; fx is optional, and a
+                     missing or None fx means the amounts are in base currency)
 
     Returns:
         Cumulative realized P&L across all exits
@@ -178,60 +226,73 @@ def calculate_realized_pnl_from_transaction_history(
     _ensure_sequence(transactions, "transactions")
 
     # Track cost basis per symbol using FIFO
-    # symbol -> list of (qty, total_cost) lots
-    cost_basis_by_symbol: dict[str, list[tuple[Decimal, Decimal]]] = {}
+    # symbol -> queue of (qty, total_cost) lots, oldest first
+    cost_basis_by_symbol: dict[str, deque[tuple[Decimal, Decimal]]] = {}
     
-    realized_pnl_cum = Decimal("0")
+    realized_pnl_cum = _ZERO
 
     for tx in transactions:
+        side = tx.side
+        is_buy = side == "BUY"
+        if not is_buy and side != "SELL":
+            # Neither entry nor exit: no cost basis or P&L impact
+            continue
+
         symbol = tx.symbol
-        qty = Decimal(str(tx.qty))
-        price = Decimal(str(tx.price))
-        commission = Decimal(str(tx.commission)) if tx.commission is not None else Decimal("0")
-        fees = Decimal(str(tx.fees)) if tx.fees is not None else Decimal("0")
-        taxes = Decimal(str(tx.taxes)) if tx.taxes is not None else Decimal("0")
-        fx = Decimal(str(tx.fx)) if hasattr(tx, 'fx') and tx.fx is not None else Decimal("1.0")
+        qty = to_decimal(tx.qty)
+        price = to_decimal(tx.price)
+        commission = to_decimal(tx.commission) if tx.commission is not None else _ZERO
+        fees = to_decimal(tx.fees) if tx.fees is not None else _ZERO
+        taxes = to_decimal(tx.taxes) if tx.taxes is not None else _ZERO
+        fx = getattr(tx, "fx", None)
         
         costs = commission + fees + taxes
 
-        if tx.side == "BUY":
+        # Base-currency value; a missing or unit FX rate needs no multiply
+        gross = qty * price
+        if fx is not None and fx != _DEFAULT_FX:
+            gross *= to_decimal(fx)
+
+        if is_buy:
             # Add to cost basis (FIFO queue)
-            total_cost = (qty * price * fx) + costs
+            total_cost = gross + costs
             
-            if symbol not in cost_basis_by_symbol:
-                cost_basis_by_symbol[symbol] = []
+            lots = cost_basis_by_symbol.get(symbol)
+            if lots is None:
+                lots = cost_basis_by_symbol[symbol] = deque()
             
-            cost_basis_by_symbol[symbol].append((qty, total_cost))
+            lots.append((qty, total_cost))
 
-        elif tx.side == "SELL":
-            # Exit: calculate realized P&L using FIFO
-            if symbol not in cost_basis_by_symbol or not cost_basis_by_symbol[symbol]:
+        else:
+            # Exit (SELL): calculate realized P&L using FIFO
+            lots = cost_basis_by_symbol.get(symbol)
+            if not lots:
                 # No cost basis available - this shouldn't happen in correct data
                 # Skip this exit (realized P&L = 0 for this transaction)
                 continue
             
-            exit_proceeds = (qty * price * fx) - costs
+            exit_proceeds = gross - costs
             
             # Calculate cost from FIFO lots
             remaining_to_exit = qty
-            exit_cost = Decimal("0")
+            exit_cost = _ZERO
             
-            while remaining_to_exit > 0 and cost_basis_by_symbol[symbol]:
-                lot_qty, lot_cost = cost_basis_by_symbol[symbol][0]
-                avg_cost_per_share = lot_cost / lot_qty
+            while remaining_to_exit > 0 and lots:
+                lot_qty, lot_cost = lots[0]
                 
                 if lot_qty <= remaining_to_exit:
-                    # Use entire lot
+                    # Use entire lot (its total cost is known, no per-share division)
                     exit_cost += lot_cost
                     remaining_to_exit -= lot_qty
-                    cost_basis_by_symbol[symbol].pop(0)
+                    lots.popleft()
                 else:
                     # Use partial lot
+                    avg_cost_per_share = lot_cost / lot_qty
                     exit_cost += remaining_to_exit * avg_cost_per_share
                     new_lot_qty = lot_qty - remaining_to_exit
                     new_lot_cost = new_lot_qty * avg_cost_per_share
-                    cost_basis_by_symbol[symbol][0] = (new_lot_qty, new_lot_cost)
-                    remaining_to_exit = Decimal("0")
+                    lots[0] = (new_lot_qty, new_lot_cost)
+                    remaining_to_exit = _ZERO
             
             realized_pnl_delta = exit_proceeds - exit_cost
             realized_pnl_cum += realized_pnl_delta
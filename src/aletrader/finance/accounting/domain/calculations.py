@@ -5,6 +5,13 @@ Pure domain logic with no I/O or logging.
 """
 
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Sequence
+
+from aletrader.finance.accounting.interfaces import CashMovementTransactionLike
+
+_ZERO = Decimal("0")
+_MONEY_QUANTUM = Decimal("0.000001")
+_PCT_QUANTUM = Decimal("0.0001")
 
 
 def _ensure_decimal(value: Decimal, name: str) -> None:
@@ -13,6 +20,18 @@ def _ensure_decimal(value: Decimal, name: str) -> None:
         raise TypeError(f"{name} must be a Decimal (got {type(value).__name__})")
 
 
+def to_decimal(value: Decimal | int | float | str) -> Decimal:
+    """
+    Convert a numeric value to Decimal via its string form.
+
+    Decimal inputs are returned as-is; they are immutable, so the
+    ``Decimal(str(value))`` round trip would only re-parse the same digits.
+    """
+    if type(value) is Decimal:
+        return value
+    return Decimal(str(value))
+
+
 def _ensure_non_empty_str(value: str, name: str) -> None:
     """Validate that a string is non-empty."""
     if not isinstance(value, str) or not value.strip():
@@ -91,7 +110,7 @@ def calculate_equity(
     _ensure_decimal(cash, "cash")
     _ensure_decimal(position_notional_sum, "position_notional_sum")
     return (cash + position_notional_sum).quantize(
-        Decimal("0.000001"),
+        _MONEY_QUANTUM,
         rounding=ROUND_HALF_UP,
     )
 
@@ -181,7 +200,7 @@ def calculate_total_pnl(
     _ensure_decimal(initial_equity, "initial_equity")
     _ensure_decimal(current_equity, "current_equity")
     return (current_equity - initial_equity).quantize(
-        Decimal("0.000001"),
+        _MONEY_QUANTUM,
         rounding=ROUND_HALF_UP,
     )
 
@@ -205,9 +224,10 @@ def calculate_total_pnl_pct(
     _ensure_decimal(total_pnl, "total_pnl")
     _ensure_decimal(initial_equity, "initial_equity")
     if initial_equity <= 0:
-        return Decimal("0")
-    pnl_pct = (total_pnl / initial_equity) * Decimal("100")
-    return pnl_pct.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+        return _ZERO
+    # Percent via exponent shift: exact, no multiplication
+    pnl_pct = (total_pnl / initial_equity).scaleb(2)
+    return pnl_pct.quantize(_PCT_QUANTUM, rounding=ROUND_HALF_UP)
 
 
 def calculate_total_pnl_metrics(
@@ -229,9 +249,28 @@ def calculate_total_pnl_metrics(
     return (total_pnl, total_pnl_pct)
 
 
+# SL/TP exits always bring cash in; the recorded side is not consulted.
+_EXIT_TYPES: frozenset[str] = frozenset({"SL", "TP"})
+
+
+# FILL side -> True if the fill brings cash in, False if it pays cash out.
+# Fills with any other side do not move cash.
+_FILL_CASH_IN: dict[str | None, bool] = {
+    "BUY": False,
+    "SELL": True,
+}
+
+
+# type -> True for deposits, False for withdrawals (side is not consulted)
+_CASH_MOVEMENT_IN: dict[str, bool] = {
+    "DEPOSIT": True,
+    "WITHDRAWAL": False,
+}
+
+
 def calculate_cash_from_initial_and_transactions(
     initial_equity: Decimal,
-    transactions: list,
+    transactions: Sequence[CashMovementTransactionLike],
 ) -> Decimal:
     """
     Calculate current cash from initial equity and all cash movements.
@@ -254,42 +293,50 @@ def calculate_cash_from_initial_and_transactions(
 
     Raises:
         TypeError: If initial_equity is not Decimal
+        ValueError: If a cash-moving transaction lacks amount, qty or price
     """
     _ensure_decimal(initial_equity, "initial_equity")
-    
+    if not transactions:
+        return initial_equity
+
     cash = initial_equity
 
     for tx in transactions:
+        tx_type = tx.type
+
+        movement_in = _CASH_MOVEMENT_IN.get(tx_type)
+        if movement_in is not None:
+            if tx.amount is None:
+                raise ValueError(f"{tx_type} transaction requires amount")
+            amount = to_decimal(tx.amount)
+            if movement_in:
+                cash += amount
+            else:
+                cash -= amount
+            continue
+
+        if tx_type in _EXIT_TYPES:
+            cash_in = True
+        elif tx_type == "FILL" and tx.side in _FILL_CASH_IN:
+            cash_in = _FILL_CASH_IN[tx.side]
+        else:
+            continue
+
         # Convert to Decimal with safety
-        commission = Decimal(str(tx.commission)) if tx.commission is not None else Decimal("0")
-        fees = Decimal(str(tx.fees)) if tx.fees is not None else Decimal("0")
-        taxes = Decimal(str(tx.taxes)) if tx.taxes is not None else Decimal("0")
+        commission = to_decimal(tx.commission) if tx.commission is not None else _ZERO
+        fees = to_decimal(tx.fees) if tx.fees is not None else _ZERO
+        taxes = to_decimal(tx.taxes) if tx.taxes is not None else _ZERO
         costs = commission + fees + taxes
-
-        if tx.type == "FILL":
-            qty = Decimal(str(tx.qty))
-            price = Decimal(str(tx.price))
-
-            if tx.side == "BUY":
-                # Cash out: qty * price + costs
-                cash -= qty * price + costs
-            elif tx.side == "SELL":
-                # Cash in: qty * price - costs
-                cash += qty * price - costs
-
-        elif tx.type in ("SL", "TP"):
-            # Exit: cash in
-            qty = Decimal(str(tx.qty))
-            price = Decimal(str(tx.price))
-            cash += qty * price - costs
-
-        elif tx.type == "DEPOSIT":
-            amount = Decimal(str(tx.amount))
-            cash += amount
-
-        elif tx.type == "WITHDRAWAL":
-            amount = Decimal(str(tx.amount))
-            cash -= amount
+        if tx.qty is None or tx.price is None:
+            raise ValueError(f"{tx_type} transaction requires qty and price")
+        gross = to_decimal(tx.qty) * to_decimal(tx.price)
+
+        if cash_in:
+            # SELL / SL / TP: cash in qty * price - costs
+            cash += gross - costs
+        else:
+            # BUY: cash out qty * price + costs
+            cash -= gross + costs
 
     return cash
 
@@ -13,6 +13,9 @@ from datetime import date
 from decimal import Decimal
 from typing import Protocol
 
+# Allowed rounding drift when checking equity invariants
+_EQUITY_ROUNDING_TOLERANCE = Decimal("0.01")
+
 
 class ValuationSnapshot(Protocol):
     """
@@ -120,7 +123,7 @@ def validate_buy_transaction_equity_invariant(
     
     # Allow small rounding differences
     difference = abs(actual_equity_change - expected_equity_change)
-    if difference > Decimal("0.01"):
+    if difference > _EQUITY_ROUNDING_TOLERANCE:
         raise ValueError(
             f"BUY transaction equity invariant violated (Rule 0.3): "
             f"equity_before={equity_before}, equity_after={equity_after}, "
@@ -162,7 +165,7 @@ def validate_sell_transaction_equity_invariant(
     
     # Allow small rounding differences
     difference = abs(actual_equity_change - expected_equity_change)
-    if difference > Decimal("0.01"):
+    if difference > _EQUITY_ROUNDING_TOLERANCE:
         raise ValueError(
             f"SELL transaction equity invariant violated (Rule 0.3): "
             f"equity_before={equity_before}, equity_after={equity_after}, "
@@ -9,6 +9,8 @@ from decimal import Decimal
 
 from trading_shared.dto.config import TradingEnvironment, normalize_trading_environment
 
+_ONE_HUNDRED = Decimal("100")
+
 
 def is_within_tolerance(
     value_a: Decimal,
@@ -591,6 +593,6 @@ def validate_risk_calculation_at_entry(
             f"Equity at entry must be > 0 for risk calculation: equity_at_entry={equity_at_entry}"
         )
 
-    risk_pct = (risk_amount / equity_at_entry) * Decimal("100")
+    risk_pct = (risk_amount / equity_at_entry) * _ONE_HUNDRED
 
     return (risk_amount, risk_pct)
@@ -9,6 +9,9 @@ from typing import Any, Sequence
 
 from aletrader.finance.accounting.interfaces import StrategyPerformanceLike
 
+_ZERO = Decimal("0")
+_ONE_HUNDRED = Decimal("100")
+
 
 def calculate_rate(numerator: int, denominator: int) -> Decimal | None:
     """
@@ -18,7 +21,7 @@ def calculate_rate(numerator: int, denominator: int) -> Decimal | None:
     """
     if denominator <= 0:
         return None
-    return (Decimal(numerator) / Decimal(denominator)) * Decimal("100")
+    return (Decimal(numerator) / Decimal(denominator)) * _ONE_HUNDRED
 
 
 def calculate_strategy_totals(
@@ -34,8 +37,8 @@ def calculate_strategy_totals(
         "total_trades": 0,
         "winning_trades": 0,
         "losing_trades": 0,
-        "total_pnl": Decimal("0"),
-        "win_rate": Decimal("0"),
+        "total_pnl": _ZERO,
+        "win_rate": _ZERO,
     }
 
     for strategy in strategies:
@@ -51,7 +54,7 @@ def calculate_strategy_totals(
         totals["win_rate"] = (
             Decimal(totals["winning_trades"])
             / Decimal(totals["total_trades"])
-            * Decimal("100")
+            * _ONE_HUNDRED
         )
 
     return totals
@@ -74,9 +77,9 @@ def apply_exit_metrics(
     updated_total = total_pnl + pnl
     updated_commission = total_commission + commission
 
-    if pnl > Decimal("0"):
+    if pnl > _ZERO:
         winning_trades += 1
-    elif pnl < Decimal("0"):
+    elif pnl < _ZERO:
         losing_trades += 1
 
     return {
@@ -4,6 +4,9 @@ Position-specific accounting calculations.
 
 from decimal import Decimal, ROUND_HALF_UP
 
+_MONEY_QUANTUM = Decimal("0.000001")
+_DEFAULT_NOTIONAL_TOLERANCE = Decimal("0.01")
+
 
 def _ensure_decimal(value: Decimal, name: str) -> None:
     """Validate that a value is a Decimal."""
@@ -34,7 +37,7 @@ def calculate_unrealized_pnl(
     _ensure_decimal(fx, "fx")
     _ensure_decimal(avg_cost, "avg_cost")
     return (qty * (last_price * fx - avg_cost)).quantize(
-        Decimal("0.000001"),
+        _MONEY_QUANTUM,
         rounding=ROUND_HALF_UP,
     )
 
@@ -81,7 +84,7 @@ def calculate_unrealized_pnl_canonical(
     last_price_base = last_price * fx
     entry_price_base = entry_price * effective_entry_fx
     unrealized_pnl = (last_price_base - entry_price_base) * qty
-    return unrealized_pnl.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+    return unrealized_pnl.quantize(_MONEY_QUANTUM, rounding=ROUND_HALF_UP)
 
 
 def validate_position_notional(
@@ -89,7 +92,7 @@ def validate_position_notional(
     qty: Decimal,
     last_price: Decimal,
     fx_rate: Decimal,
-    tolerance: Decimal = Decimal("0.01"),
+    tolerance: Decimal = _DEFAULT_NOTIONAL_TOLERANCE,
 ) -> Decimal:
     """
     Validate and correct position notional value.
@@ -126,7 +129,7 @@ def evaluate_notional_mismatch(
     qty: Decimal,
     last_price: Decimal,
     fx_rate: Decimal,
-    tolerance: Decimal = Decimal("0.01"),
+    tolerance: Decimal = _DEFAULT_NOTIONAL_TOLERANCE,
 ) -> tuple[Decimal, Decimal, bool]:
     """
     Evaluate notional mismatch against expected value.
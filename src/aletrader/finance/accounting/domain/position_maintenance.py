@@ -4,10 +4,39 @@ Position maintenance helpers.
 Pure functions for recalculating position metrics from transaction history.
 """
 
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Sequence
 
-from aletrader.finance.accounting.interfaces import AvgCostTransactionLike
+from aletrader.finance.accounting.domain.calculations import to_decimal
+from aletrader.finance.accounting.interfaces import (
+    AvgCostTransactionLike,
+    PositionTransactionLike,
+)
+
+_ZERO = Decimal("0")
+
+
+@dataclass(frozen=True, slots=True)
+class ReconstructedPositions:
+    """
+    Columnar (struct-of-arrays) result of position reconstruction.
+
+    Each field holds one column, aligned by index across all fields.
+    Intended for consumers that aggregate a few columns and never need
+    per-position dictionaries.
+    """
+
+    symbol: tuple[str, ...]
+    qty: tuple[Decimal, ...]
+    avg_cost: tuple[Decimal, ...]
+    last_price: tuple[Decimal, ...]
+    fx: tuple[Decimal, ...]
+    notional: tuple[Decimal, ...]
+    unrealized_pnl: tuple[Decimal, ...]
+
+    def __len__(self) -> int:
+        return len(self.symbol)
 
 
 def calculate_avg_cost_from_transactions(
@@ -21,8 +50,8 @@ def calculate_avg_cost_from_transactions(
     if not transactions:
         return None
 
-    total_cost = Decimal("0")
-    total_qty = Decimal("0")
+    total_cost = _ZERO
+    total_qty = _ZERO
 
     for tx in transactions:
         if tx.side == "BUY":
@@ -33,8 +62,8 @@ def calculate_avg_cost_from_transactions(
         elif tx.side == "SELL":
             total_qty -= tx.qty
             if total_qty <= 0:
-                total_cost = Decimal("0")
-                total_qty = Decimal("0")
+                total_cost = _ZERO
+                total_qty = _ZERO
 
     if total_qty <= 0:
         return None
@@ -56,22 +85,23 @@ def calculate_avg_entry_price_and_fx_from_transactions(
     if not transactions:
         return None
 
-    total_qty = Decimal("0")
-    total_price_qty = Decimal("0")
-    total_base_cost = Decimal("0")
+    total_qty = _ZERO
+    total_price_qty = _ZERO
+    total_base_cost = _ZERO
 
     for tx in transactions:
-        qty = Decimal(str(tx.qty))
-        price = Decimal(str(tx.price))
-        fx = Decimal(str(tx.fx))
+        qty = to_decimal(tx.qty)
+        price = to_decimal(tx.price)
+        fx = to_decimal(tx.fx)
+        side = tx.side
 
-        if tx.side == "BUY":
+        if side == "BUY":
             total_qty += qty
             total_price_qty += qty * price
             total_base_cost += qty * price * fx
             continue
 
-        if tx.side == "SELL":
+        if side == "SELL":
             if total_qty <= 0:
                 continue
 
@@ -80,9 +110,9 @@ def calculate_avg_entry_price_and_fx_from_transactions(
 
             total_qty -= qty
             if total_qty <= 0:
-                total_qty = Decimal("0")
-                total_price_qty = Decimal("0")
-                total_base_cost = Decimal("0")
+                total_qty = _ZERO
+                total_price_qty = _ZERO
+                total_base_cost = _ZERO
                 continue
 
             total_price_qty -= avg_price * qty
@@ -101,33 +131,29 @@ def calculate_avg_entry_price_and_fx_from_transactions(
     return avg_price, avg_fx
 
 
-def reconstruct_positions_from_transactions(
-    transactions: list,
+# (symbol, qty, avg_cost, last_price, fx, notional, unrealized_pnl)
+_OpenPosition = tuple[str, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal]
+
+
+def _iter_open_positions(
+    transactions: Sequence[PositionTransactionLike],
     market_prices: dict[str, Decimal],
     fx_rates: dict[str, Decimal],
-) -> list[dict]:
+) -> Iterator[_OpenPosition]:
     """
-    Reconstruct open positions from transaction history.
+    Yield the state of each open position from transaction history.
 
     For each symbol:
     1. Find last transaction
     2. If position_qty_after > 0, position is open
     3. Calculate unrealized P&L using current market price
-
-    Args:
-        transactions: All position transactions (PositionTransactionLike)
-        market_prices: Current market prices by symbol
-        fx_rates: Current FX rates by symbol
-
-    Returns:
-        List of position state dictionaries
     """
     from aletrader.finance.accounting.domain.position_calculations import (
         calculate_unrealized_pnl,
     )
 
     # Group by symbol and find last transaction
-    last_tx_per_symbol: dict[str, any] = {}
+    last_tx_per_symbol: dict[str, PositionTransactionLike] = {}
 
     for tx in transactions:
         symbol = tx.symbol
@@ -138,20 +164,17 @@ def reconstruct_positions_from_transactions(
             if tx.timestamp > last_tx_per_symbol[symbol].timestamp:
                 last_tx_per_symbol[symbol] = tx
 
-    positions = []
-
     for symbol, last_tx in last_tx_per_symbol.items():
-        qty_after = Decimal(str(last_tx.position_qty_after))
+        qty_after = to_decimal(last_tx.position_qty_after)
 
         if qty_after <= 0:
             continue  # Position closed
 
         # Get current market data (fallback to last transaction price/fx)
-        last_price = market_prices.get(symbol, Decimal(str(last_tx.price)))
-        fx_rate = fx_rates.get(symbol, Decimal(str(last_tx.fx_rate_used)))
-        avg_cost = Decimal(str(last_tx.position_avg_cost_after))
+        last_price = market_prices.get(symbol, to_decimal(last_tx.price))
+        fx_rate = fx_rates.get(symbol, to_decimal(last_tx.fx_rate_used))
+        avg_cost = to_decimal(last_tx.position_avg_cost_after)
 
-        # Calculate unrealized P&L
         unrealized_pnl = calculate_unrealized_pnl(
             qty=qty_after,
             last_price=last_price,
@@ -159,20 +182,72 @@ def reconstruct_positions_from_transactions(
             avg_cost=avg_cost,
         )
 
-        # Calculate notional (market value)
+        # Notional (market value)
         notional = qty_after * last_price * fx_rate
 
-        positions.append(
-            {
-                "symbol": symbol,
-                "qty": qty_after,
-                "avg_cost": avg_cost,
-                "last_price": last_price,
-                "fx": fx_rate,
-                "notional": notional,
-                "unrealized_pnl": unrealized_pnl,
-            }
-        )
+        yield symbol, qty_after, avg_cost, last_price, fx_rate, notional, unrealized_pnl
+
+
+def reconstruct_positions_from_transactions(
+    transactions: Sequence[PositionTransactionLike],
+    market_prices: dict[str, Decimal],
+    fx_rates: dict[str, Decimal],
+) -> list[dict[str, str | Decimal]]:
+    """
+    Reconstruct open positions from transaction history.
 
-    return positions
+    Args:
+        transactions: All position transactions (PositionTransactionLike)
+        market_prices: Current market prices by symbol
+        fx_rates: Current FX rates by symbol
 
+    Returns:
+        List of position state dictionaries
+    """
+    open_positions = _iter_open_positions(transactions, market_prices, fx_rates)
+    return [
+        {
+            "symbol": symbol,
+            "qty": qty,
+            "avg_cost": avg_cost,
+            "last_price": last_price,
+            "fx": fx,
+            "notional": notional,
+            "unrealized_pnl": unrealized_pnl,
+        }
+        for symbol, qty, avg_cost, last_price, fx, notional, unrealized_pnl in open_positions
+    ]
+
+
+def reconstruct_position_columns_from_transactions(
+    transactions: Sequence[PositionTransactionLike],
+    market_prices: dict[str, Decimal],
+    fx_rates: dict[str, Decimal],
+) -> ReconstructedPositions:
+    """
+    Reconstruct open positions from transaction history as columns.
+
+    Same positions as reconstruct_positions_from_transactions, without
+    building a dictionary per position.
+
+    Args:
+        transactions: All position transactions (PositionTransactionLike)
+        market_prices: Current market prices by symbol
+        fx_rates: Current FX rates by symbol
+
+    Returns:
+        Columnar position states
+    """
+    rows = list(_iter_open_positions(transactions, market_prices, fx_rates))
+    if not rows:
+        return ReconstructedPositions((), (), (), (), (), (), ())
+    symbol, qty, avg_cost, last_price, fx, notional, unrealized_pnl = zip(*rows)
+    return ReconstructedPositions(
+        symbol=symbol,
+        qty=qty,
+        avg_cost=avg_cost,
+        last_price=last_price,
+        fx=fx,
+        notional=notional,
+        unrealized_pnl=unrealized_pnl,
+    )
@@ -5,6 +5,8 @@ Pure domain functions for transaction processing and P&L calculations.
 All monetary values use Decimal with ROUND_HALF_UP rounding.
 """
 
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP, getcontext
 from typing import Literal, TypedDict
 
@@ -13,6 +15,13 @@ from typing import Literal, TypedDict
 getcontext().rounding = ROUND_HALF_UP
 getcontext().prec = 28  # High precision for financial calculations
 
+_ZERO = Decimal("0")
+_ONE_HUNDRED = Decimal("100")
+_MONEY_QUANTUM = Decimal("0.000001")
+_PCT_QUANTUM = Decimal("0.0001")
+_ZERO_COST = Decimal("0.000000")  # calculate_cost_total(0, 0, 0)
+_SIDES = frozenset({"BUY", "SELL"})
+
 
 class AccountStateBefore(TypedDict):
     """Account state before transaction (Balance Sheet Approach)."""
@@ -31,6 +40,10 @@ class PositionStateBefore(TypedDict):
     fx: Decimal
 
 
+# Stand-in passed to handlers when there is no open position
+_FLAT_POSITION = PositionStateBefore(qty=_ZERO, avg_cost=_ZERO, last_price=_ZERO, fx=_ZERO)
+
+
 class TransactionInput(TypedDict):
     """Transaction input parameters."""
 
@@ -61,6 +74,24 @@ class TransactionResult(TypedDict):
     position_removed: bool
 
 
+@dataclass(frozen=True, slots=True)
+class _TransactionAmounts:
+    """Prices and monetary amounts of one transaction, computed once at dispatch."""
+
+    qty: Decimal
+    price: Decimal
+    fx: Decimal
+    gross: Decimal  # Unrounded qty * price * fx, kept for cost basis
+    gross_value: Decimal  # gross rounded to 6dp
+    cost_total: Decimal
+    net_value: Decimal
+
+
+def _quantize_money(value: Decimal) -> Decimal:
+    """Round a monetary value to 6 decimal places (ROUND_HALF_UP)."""
+    return value.quantize(_MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+
+
 def calculate_gross_value(qty: Decimal, price: Decimal, fx: Decimal) -> Decimal:
     """
     Calculate gross value: qty * price * fx.
@@ -73,7 +104,7 @@ def calculate_gross_value(qty: Decimal, price: Decimal, fx: Decimal) -> Decimal:
     Returns:
         Gross value in account currency
     """
-    return (qty * price * fx).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+    return _quantize_money(qty * price * fx)
 
 
 def calculate_cost_total(commission: Decimal, fees: Decimal, taxes: Decimal) -> Decimal:
@@ -88,7 +119,7 @@ def calculate_cost_total(commission: Decimal, fees: Decimal, taxes: Decimal) ->
     Returns:
         Total costs in account currency
     """
-    return (commission + fees + taxes).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+    return _quantize_money(commission + fees + taxes)
 
 
 def calculate_net_value(
@@ -128,113 +159,200 @@ def apply_transaction(
     Returns:
         Transaction result with all calculated fields
     """
+    # Resolve the handler for this (type, side) pair with a single lookup
+    tx_type = tx_input["type"]
+    side = tx_input["side"]
+    key = (tx_type, side)
+    handler = _TRANSACTION_HANDLERS.get(key)
+    if handler is None:
+        if side not in _SIDES:
+            raise ValueError(f"Unsupported side {side!r} for {tx_type}")
+        # ADJUSTMENT (and any other type without a handler)
+        raise ValueError(f"Transaction type {tx_type} with side {side} not yet implemented")
+    if position_before is None:
+        missing_position_error = _POSITION_REQUIRED_ERRORS.get(key)
+        if missing_position_error is not None:
+            raise ValueError(missing_position_error)
+        position = _FLAT_POSITION
+    else:
+        position = position_before
+
+    # Unpack the input once; handlers work on these locals, not the dict
+    qty = tx_input["qty"]
+    price = tx_input["price"]
+    fx = tx_input["fx"]
+
     # Calculate monetary values
-    gross_value = calculate_gross_value(tx_input["qty"], tx_input["price"], tx_input["fx"])
-    cost_total = calculate_cost_total(tx_input["commission"], tx_input["fees"], tx_input["taxes"])
+    # Unrounded gross is kept for cost basis; gross_value is its 6dp rounding
+    gross = qty * price * fx
+    gross_value = _quantize_money(gross)
+    commission = tx_input["commission"]
+    fees = tx_input["fees"]
+    taxes = tx_input["taxes"]
+    if commission or fees or taxes:
+        cost_total = calculate_cost_total(commission, fees, taxes)
+    else:
+        # Cost-free transactions (typically MARK_TO_MARKET) skip the sum and rounding
+        cost_total = _ZERO_COST
 
     # Calculate net cash impact
-    if tx_input["side"] == "BUY":
+    if side == "BUY":
         net_value = -(gross_value + cost_total)  # Negative: cash decreases
     else:  # SELL
         net_value = gross_value - cost_total  # Positive: cash increases
 
-    # Handle different transaction types
-    tx_type = tx_input["type"]
+    amounts = _TransactionAmounts(
+        qty=qty,
+        price=price,
+        fx=fx,
+        gross=gross,
+        gross_value=gross_value,
+        cost_total=cost_total,
+        net_value=net_value,
+    )
+    return handler(account_before, position, amounts)
+
+
+def apply_transactions(
+    account_before: AccountStateBefore,
+    position_before: PositionStateBefore | None,
+    tx_inputs: Sequence[TransactionInput],
+) -> list[TransactionResult]:
+    """
+    Apply a sequence of transactions for one position, in order.
 
-    if tx_type in ("ORDER", "ORDER_SL", "ORDER_TP"):
-        # Orders have no cash/position impact
-        return _apply_order_transaction(account_before, position_before, tx_input, gross_value, cost_total, net_value)
-    if tx_type == "MARK_TO_MARKET":
-        # Mark to market only updates prices
-        return _apply_mark_to_market(account_before, position_before, tx_input, gross_value, cost_total, net_value)
-    if tx_type in ("FILL", "SL", "TP"):
-        # Fills affect cash and positions
-        if tx_input["side"] == "BUY":
-            return _apply_buy_fill(account_before, position_before, tx_input, gross_value, cost_total, net_value)
-        return _apply_sell_fill(account_before, position_before, tx_input, gross_value, cost_total, net_value)
-    # ADJUSTMENT
-    raise ValueError(f"Transaction type {tx_type} not yet implemented")
+    Each result becomes the account and position state for the next
+    transaction, so a ledger replay is a single call. The replay works on
+    one private copy of the account and position state and updates it in
+    place, so the caller's dicts are left untouched.
+
+    Args:
+        account_before: Account state before the first transaction
+        position_before: Position state before the first transaction (None if no position)
+        tx_inputs: Transactions in execution order
+
+    Returns:
+        One transaction result per input, in the same order
+    """
+    results: list[TransactionResult] = []
+    account = AccountStateBefore(**account_before)
+    working_position = PositionStateBefore(**position_before) if position_before else None
+    position = working_position
+
+    for tx_input in tx_inputs:
+        result = apply_transaction(account, position, tx_input)
+        results.append(result)
+        account["cash"] = result["cash_after"]
+        if result["position_qty_after"] > 0:
+            if working_position is None:
+                working_position = PositionStateBefore(
+                    qty=result["position_qty_after"],
+                    avg_cost=result["position_avg_cost_after"],
+                    last_price=result["last_price_after"],
+                    fx=result["fx_after"],
+                )
+            else:
+                working_position["qty"] = result["position_qty_after"]
+                working_position["avg_cost"] = result["position_avg_cost_after"]
+                working_position["last_price"] = result["last_price_after"]
+                working_position["fx"] = result["fx_after"]
+            position = working_position
+        else:
+            position = None
+
+    return results
 
 
 def _apply_order_transaction(
     account_before: AccountStateBefore,
-    position_before: PositionStateBefore | None,
-    tx_input: TransactionInput,
-    gross_value: Decimal,
-    cost_total: Decimal,
-    net_value: Decimal,
+    position_before: PositionStateBefore,
+    amounts: _TransactionAmounts,
 ) -> TransactionResult:
     """Apply ORDER/ORDER_SL/ORDER_TP transaction (no cash/position impact)."""
+    qty_before = position_before["qty"]
+    avg_cost_before = position_before["avg_cost"]
+    notional_before = qty_before * position_before["last_price"] * position_before["fx"]
+
     return TransactionResult(
-        gross_value=gross_value,
-        cost_total=cost_total,
-        net_value=net_value,
+        gross_value=amounts.gross_value,
+        cost_total=amounts.cost_total,
+        net_value=amounts.net_value,
         cash_after=account_before["cash"],  # Unchanged
-        position_qty_after=position_before["qty"] if position_before else Decimal("0"),
-        position_avg_cost_after=position_before["avg_cost"] if position_before else Decimal("0"),
-        position_notional_after=(
-            position_before["qty"] * position_before["last_price"] * position_before["fx"]
-            if position_before
-            else Decimal("0")
-        ),
-        realized_pnl_delta=Decimal("0"),
-        last_price_after=tx_input["price"],
-        fx_after=tx_input["fx"],
+        position_qty_after=qty_before,
+        position_avg_cost_after=avg_cost_before,
+        position_notional_after=notional_before,
+        realized_pnl_delta=_ZERO,
+        last_price_after=amounts.price,
+        fx_after=amounts.fx,
         position_removed=False,
     )
 
 
+# Fields MARK_TO_MARKET never changes; copied per call and the rest overwritten
+_MARK_TO_MARKET_RESULT_TEMPLATE = TransactionResult(
+    gross_value=_ZERO,
+    cost_total=_ZERO,
+    net_value=_ZERO,
+    cash_after=_ZERO,
+    position_qty_after=_ZERO,
+    position_avg_cost_after=_ZERO,
+    position_notional_after=_ZERO,
+    realized_pnl_delta=_ZERO,
+    last_price_after=_ZERO,
+    fx_after=_ZERO,
+    position_removed=False,
+)
+
+
 def _apply_mark_to_market(
     account_before: AccountStateBefore,
-    position_before: PositionStateBefore | None,
-    tx_input: TransactionInput,
-    gross_value: Decimal,
-    cost_total: Decimal,
-    net_value: Decimal,
+    position_before: PositionStateBefore,
+    amounts: _TransactionAmounts,
 ) -> TransactionResult:
-    """Apply MARK_TO_MARKET transaction (update prices only)."""
-    if not position_before:
-        raise ValueError("MARK_TO_MARKET requires existing position")
-
-    return TransactionResult(
-        gross_value=gross_value,
-        cost_total=cost_total,
-        net_value=net_value,
-        cash_after=account_before["cash"],  # Unchanged
-        position_qty_after=position_before["qty"],
-        position_avg_cost_after=position_before["avg_cost"],  # Unchanged
-        position_notional_after=position_before["qty"] * tx_input["price"] * tx_input["fx"],
-        realized_pnl_delta=Decimal("0"),
-        last_price_after=tx_input["price"],
-        fx_after=tx_input["fx"],
-        position_removed=False,
-    )
+    """Apply MARK_TO_MARKET transaction (update prices only, qty from the position)."""
+    qty_before = position_before["qty"]
+    price = amounts.price
+    fx = amounts.fx
+
+    result = _MARK_TO_MARKET_RESULT_TEMPLATE.copy()
+    result["gross_value"] = amounts.gross_value
+    result["cost_total"] = amounts.cost_total
+    result["net_value"] = amounts.net_value
+    result["cash_after"] = account_before["cash"]  # Unchanged
+    result["position_qty_after"] = qty_before
+    result["position_avg_cost_after"] = position_before["avg_cost"]  # Unchanged
+    result["position_notional_after"] = qty_before * price * fx
+    result["last_price_after"] = price
+    result["fx_after"] = fx
+    return result
 
 
 def _apply_buy_fill(
     account_before: AccountStateBefore,
-    position_before: PositionStateBefore | None,
-    tx_input: TransactionInput,
-    gross_value: Decimal,
-    cost_total: Decimal,
-    net_value: Decimal,
+    position_before: PositionStateBefore,
+    amounts: _TransactionAmounts,
 ) -> TransactionResult:
     """Apply BUY FILL transaction (entry or add)."""
-    cash_after = account_before["cash"] + net_value  # net_value is negative for BUY
-
-    if position_before is None:
+    qty = amounts.qty
+    price = amounts.price
+    fx = amounts.fx
+    cost_total = amounts.cost_total
+    cash_after = account_before["cash"] + amounts.net_value  # net_value is negative for BUY
+    qty_before = position_before["qty"]
+
+    if qty_before == 0:
         # Entry: new position
         # Include transaction costs in average cost to maintain equity consistency
-        qty_after = tx_input["qty"]
-        total_cost = tx_input["qty"] * tx_input["price"] * tx_input["fx"] + cost_total
-        avg_cost_after = total_cost / tx_input["qty"]
+        qty_after = qty
+        total_cost = amounts.gross + cost_total
+        avg_cost_after = total_cost / qty
     else:
         # Add: increase position, recalculate average cost
         # Include transaction costs in average cost
-        cost_before = position_before["qty"] * position_before["avg_cost"]
-        cost_new = tx_input["qty"] * tx_input["price"] * tx_input["fx"] + cost_total
-        qty_after = position_before["qty"] + tx_input["qty"]
-        avg_cost_after = (cost_before + cost_new) / qty_after
+        # cost_before + cost_new as one fused multiply-add (single rounding)
+        cost_new = amounts.gross + cost_total
+        qty_after = qty_before + qty
+        avg_cost_after = qty_before.fma(position_before["avg_cost"], cost_new) / qty_after
 
     # CRITICAL: Ensure avg_cost is always positive
     # This prevents the zero avg_cost bug (Issue #1)
@@ -242,10 +360,10 @@ def _apply_buy_fill(
         raise ValueError(
             f"Calculated average cost must be > 0, got {avg_cost_after}. "
             f"This indicates a bug in cost calculation. "
-            f"qty={qty_after}, price={tx_input['price']}, fx={tx_input['fx']}, cost_total={cost_total}"
+            f"qty={qty_after}, price={price}, fx={fx}, cost_total={cost_total}"
         )
 
-    position_notional_after = qty_after * tx_input["price"] * tx_input["fx"]
+    position_notional_after = qty_after * price * fx
 
     # CRITICAL FIX: Transaction costs on BUY do NOT affect realized P&L
     # They are already included in avg_cost, which affects unrealized P&L
@@ -253,70 +371,117 @@ def _apply_buy_fill(
     # Setting realized_pnl_delta = -cost_total was DOUBLE-COUNTING costs!
     # This was the root cause of the £680 P&L consistency violation (FR-013)
     # Balance Sheet Approach: P&L delta retained for informational purposes only
-    realized_pnl_delta = Decimal("0")
+    realized_pnl_delta = _ZERO
 
     return TransactionResult(
-        gross_value=gross_value,
+        gross_value=amounts.gross_value,
         cost_total=cost_total,
-        net_value=net_value,
+        net_value=amounts.net_value,
         cash_after=cash_after,
         position_qty_after=qty_after,
         position_avg_cost_after=avg_cost_after,
         position_notional_after=position_notional_after,
         realized_pnl_delta=realized_pnl_delta,  # Always 0 for BUY (costs captured in avg_cost)
-        last_price_after=tx_input["price"],
-        fx_after=tx_input["fx"],
+        last_price_after=price,
+        fx_after=fx,
         position_removed=False,
     )
 
 
 def _apply_sell_fill(
     account_before: AccountStateBefore,
-    position_before: PositionStateBefore | None,
-    tx_input: TransactionInput,
-    gross_value: Decimal,
-    cost_total: Decimal,
-    net_value: Decimal,
+    position_before: PositionStateBefore,
+    amounts: _TransactionAmounts,
 ) -> TransactionResult:
     """Apply SELL FILL transaction (reduce or close)."""
-    if position_before is None:
-        raise ValueError("SELL FILL requires existing position")
-
-    if position_before["qty"] < tx_input["qty"]:
-        raise ValueError(f"Insufficient position: have {position_before['qty']}, trying to sell {tx_input['qty']}")
+    qty = amounts.qty
+    price = amounts.price
+    fx = amounts.fx
+    gross_value = amounts.gross_value
+    cost_total = amounts.cost_total
+    net_value = amounts.net_value
+    qty_before = position_before["qty"]
+    avg_cost_before = position_before["avg_cost"]
+
+    if qty_before < qty:
+        raise ValueError(f"Insufficient position: have {qty_before}, trying to sell {qty}")
 
     cash_after = account_before["cash"] + net_value  # net_value is positive for SELL
 
     # Calculate realized P&L (informational only - not stored in database)
-    pnl_gross = (tx_input["price"] * tx_input["fx"] - position_before["avg_cost"]) * tx_input["qty"]
-    realized_pnl_delta = pnl_gross - cost_total
-
-    # Update position
-    qty_after = position_before["qty"] - tx_input["qty"]
-    position_removed = qty_after == 0
-
-    if position_removed:
-        avg_cost_after = Decimal("0")
-        position_notional_after = Decimal("0")
-    else:
-        avg_cost_after = position_before["avg_cost"]  # Unchanged for partial close
-        position_notional_after = qty_after * tx_input["price"] * tx_input["fx"]
+    # (price * fx - avg_cost) * qty - cost_total as one fused multiply-add
+    realized_pnl_delta = (price * fx - avg_cost_before).fma(qty, -cost_total)
+
+    if qty == qty_before:
+        # Full close: position removed, nothing left to carry
+        return TransactionResult(
+            gross_value=gross_value,
+            cost_total=cost_total,
+            net_value=net_value,
+            cash_after=cash_after,
+            position_qty_after=_ZERO,
+            position_avg_cost_after=_ZERO,
+            position_notional_after=_ZERO,
+            realized_pnl_delta=realized_pnl_delta,  # Informational only (not stored)
+            last_price_after=price,
+            fx_after=fx,
+            position_removed=True,
+        )
 
+    # Partial close: avg_cost unchanged
+    qty_after = qty_before - qty
     return TransactionResult(
         gross_value=gross_value,
         cost_total=cost_total,
         net_value=net_value,
         cash_after=cash_after,
         position_qty_after=qty_after,
-        position_avg_cost_after=avg_cost_after,
-        position_notional_after=position_notional_after,
+        position_avg_cost_after=avg_cost_before,
+        position_notional_after=qty_after * price * fx,
         realized_pnl_delta=realized_pnl_delta,  # Informational only (not stored)
-        last_price_after=tx_input["price"],
-        fx_after=tx_input["fx"],
-        position_removed=position_removed,
+        last_price_after=price,
+        fx_after=fx,
+        position_removed=False,
     )
 
 
+_TransactionHandler = Callable[
+    [AccountStateBefore, PositionStateBefore, _TransactionAmounts],
+    TransactionResult,
+]
+
+# (type, side) -> handler. Orders have no cash/position impact, mark to market
+# only updates prices, fills (FILL/SL/TP) affect cash and positions.
+# ADJUSTMENT is intentionally absent (not yet implemented).
+_TRANSACTION_HANDLERS: dict[tuple[str, str], _TransactionHandler] = {
+    ("ORDER", "BUY"): _apply_order_transaction,
+    ("ORDER", "SELL"): _apply_order_transaction,
+    ("ORDER_SL", "BUY"): _apply_order_transaction,
+    ("ORDER_SL", "SELL"): _apply_order_transaction,
+    ("ORDER_TP", "BUY"): _apply_order_transaction,
+    ("ORDER_TP", "SELL"): _apply_order_transaction,
+    ("MARK_TO_MARKET", "BUY"): _apply_mark_to_market,
+    ("MARK_TO_MARKET", "SELL"): _apply_mark_to_market,
+    ("FILL", "BUY"): _apply_buy_fill,
+    ("FILL", "SELL"): _apply_sell_fill,
+    ("SL", "BUY"): _apply_buy_fill,
+    ("SL", "SELL"): _apply_sell_fill,
+    ("TP", "BUY"): _apply_buy_fill,
+    ("TP", "SELL"): _apply_sell_fill,
+}
+
+
+# (type, side) pairs that act on an open position -> error raised without one.
+# Checked once at dispatch; handlers receive _FLAT_POSITION otherwise.
+_POSITION_REQUIRED_ERRORS: dict[tuple[str, str], str] = {
+    ("MARK_TO_MARKET", "BUY"): "MARK_TO_MARKET requires existing position",
+    ("MARK_TO_MARKET", "SELL"): "MARK_TO_MARKET requires existing position",
+    ("FILL", "SELL"): "SELL FILL requires existing position",
+    ("SL", "SELL"): "SELL FILL requires existing position",
+    ("TP", "SELL"): "SELL FILL requires existing position",
+}
+
+
 def calculate_drawdown(
     max_equity_to_date: Decimal,
     current_equity: Decimal,
@@ -332,7 +497,7 @@ def calculate_drawdown(
         Drawdown percentage (0-100)
     """
     if max_equity_to_date <= 0:
-        return Decimal("0")
+        return _ZERO
 
-    dd = ((max_equity_to_date - current_equity) / max_equity_to_date) * Decimal("100")
-    return dd.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+    dd = ((max_equity_to_date - current_equity) / max_equity_to_date) * _ONE_HUNDRED
+    return dd.quantize(_PCT_QUANTUM, rounding=ROUND_HALF_UP)
@@ -5,7 +5,18 @@ Facade pattern for centralized access to pure finance logic.
 """
 
 from decimal import Decimal
-from typing import Protocol, Sequence
+from typing import TYPE_CHECKING, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from aletrader.finance.accounting.domain.position_maintenance import (
+        ReconstructedPositions,
+    )
+    from aletrader.finance.accounting.domain.transactions import (
+        AccountStateBefore as DomainAccountStateBefore,
+        PositionStateBefore as DomainPositionStateBefore,
+        TransactionInput as DomainTransactionInput,
+        TransactionResult as DomainTransactionResult,
+    )
 
 
 class PositionStateLike(Protocol):
@@ -35,6 +46,41 @@ class LedgerTransactionLike(Protocol):
     taxes: Decimal | float | int | None
 
 
+class TradeHistoryTransactionLike(Protocol):
+    """
+    Protocol for ledger transactions used in realized P&L derivation.
+
+    Members are read-only so that both mutable records and frozen rows with
+    narrower (e.g. Decimal-only) field types satisfy the protocol.
+    """
+
+    @property
+    def symbol(self) -> str: ...
+
+    @property
+    def side(self) -> str: ...
+
+    @property
+    def qty(self) -> Decimal | float | int: ...
+
+    @property
+    def price(self) -> Decimal | float | int: ...
+
+    @property
+    def commission(self) -> Decimal | float | int | None: ...
+
+    @property
+    def fees(self) -> Decimal | float | int | None: ...
+
+    @property
+    def taxes(self) -> Decimal | float | int | None: ...
+
+    @property
+    def fx(self) -> Decimal | float | int | None:
+        """Optional: absent or None means already in base currency."""
+        ...
+
+
 class CashMovementTransactionLike(Protocol):
     """Protocol for transactions that affect cash balance."""
 
@@ -200,6 +246,21 @@ class AccountFinancialCalculator:
             tx_input=tx_input,
         )
 
+    @staticmethod
+    def apply_transactions(
+        account_before: "DomainAccountStateBefore",
+        position_before: "DomainPositionStateBefore | None",
+        tx_inputs: Sequence["DomainTransactionInput"],
+    ) -> list["DomainTransactionResult"]:
+        """Apply a sequence of transactions for one position, in order."""
+        from aletrader.finance.accounting.domain.transactions import apply_transactions
+
+        return apply_transactions(
+            account_before=account_before,
+            position_before=position_before,
+            tx_inputs=tx_inputs,
+        )
+
     @staticmethod
     def calculate_drawdown(
         max_equity_to_date: Decimal,
@@ -354,7 +415,7 @@ class AccountFinancialCalculator:
     @staticmethod
     def calculate_cash_from_initial_and_transactions(
         initial_equity: Decimal,
-        transactions: list,
+        transactions: Sequence[CashMovementTransactionLike],
     ) -> Decimal:
         """Calculate current cash from initial equity and transactions."""
         from aletrader.finance.accounting.domain.calculations import (
@@ -376,10 +437,10 @@ class AccountFinancialCalculator:
 
     @staticmethod
     def reconstruct_positions_from_transactions(
-        transactions: list,
+        transactions: Sequence[PositionTransactionLike],
         market_prices: dict[str, Decimal],
         fx_rates: dict[str, Decimal],
-    ) -> list[dict]:
+    ) -> list[dict[str, str | Decimal]]:
         """Reconstruct open positions from transaction history."""
         from aletrader.finance.accounting.domain.position_maintenance import (
             reconstruct_positions_from_transactions,
@@ -387,6 +448,21 @@ class AccountFinancialCalculator:
 
         return reconstruct_positions_from_transactions(transactions, market_prices, fx_rates)
 
+    @staticmethod
+    def reconstruct_position_columns_from_transactions(
+        transactions: Sequence[PositionTransactionLike],
+        market_prices: dict[str, Decimal],
+        fx_rates: dict[str, Decimal],
+    ) -> "ReconstructedPositions":
+        """Reconstruct open positions from transaction history as columns."""
+        from aletrader.finance.accounting.domain.position_maintenance import (
+            reconstruct_position_columns_from_transactions,
+        )
+
+        return reconstruct_position_columns_from_transactions(
+            transactions, market_prices, fx_rates
+        )
+
 
     @staticmethod
     def validate_balance_invariant(
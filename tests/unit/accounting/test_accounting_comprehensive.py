@@ -9,6 +9,7 @@ from decimal import Decimal
 
 from aletrader.finance.accounting.domain.transactions import (
     apply_transaction,
+    apply_transactions,
     calculate_cost_total,
     calculate_drawdown,
     calculate_gross_value,
@@ -16,6 +17,40 @@ from aletrader.finance.accounting.domain.transactions import (
     PositionStateBefore,
     TransactionInput,
 )
+from transaction_builders import fill_tx
+
+# Assertion tolerances: values (avg cost, P&L) and cash balances
+_TOLERANCE = Decimal("0.000001")
+_CASH_TOLERANCE = Decimal("0.01")
+
+# Recurring fixture amounts, built once at import
+_D0 = Decimal("0")
+_D1 = Decimal("1")
+_D5 = Decimal("5")
+_D10 = Decimal("10")
+_D15 = Decimal("15")
+_D90 = Decimal("90")
+_D100 = Decimal("100")
+_D110 = Decimal("110")
+_D120 = Decimal("120")
+_D1000 = Decimal("1000")
+_D5000 = Decimal("5000")
+_D10000 = Decimal("10000")
+_FX_1 = Decimal("1.0")
+_FX_1_5 = Decimal("1.5")
+_FEES = Decimal("0.5")
+_TAXES = Decimal("0.2")
+_COST_TOTAL = _D1 + _FEES + _TAXES  # commission 1 + fees + taxes
+
+
+def _position(qty: str, avg_cost: str, last_price: str) -> PositionStateBefore:
+    """Build a base-currency position state from string amounts."""
+    return {
+        "qty": Decimal(qty),
+        "avg_cost": Decimal(avg_cost),
+        "last_price": Decimal(last_price),
+        "fx": _FX_1,
+    }
 
 
 # ============================================================================
@@ -25,61 +60,61 @@ from aletrader.finance.accounting.domain.transactions import (
 
 def test_calculate_gross_value_basic():
     """Test basic gross value calculation."""
-    result = calculate_gross_value(Decimal("10"), Decimal("100"), Decimal("1.0"))
+    result = calculate_gross_value(_D10, _D100, _FX_1)
     assert result == Decimal("1000.000000")
 
 
 def test_calculate_gross_value_with_fx():
     """Test gross value calculation with FX rate."""
-    result = calculate_gross_value(Decimal("10"), Decimal("100"), Decimal("1.5"))
+    result = calculate_gross_value(_D10, _D100, _FX_1_5)
     assert result == Decimal("1500.000000")
 
 
 def test_calculate_gross_value_precision():
     """Test gross value calculation preserves precision."""
-    result = calculate_gross_value(Decimal("0.001"), Decimal("123.456"), Decimal("1.0"))
+    result = calculate_gross_value(Decimal("0.001"), Decimal("123.456"), _FX_1)
     assert result == Decimal("0.123456")
 
 
 def test_calculate_cost_total_basic():
     """Test basic cost total calculation."""
-    result = calculate_cost_total(Decimal("1"), Decimal("0.5"), Decimal("0.2"))
+    result = calculate_cost_total(_D1, _FEES, _TAXES)
     assert result == Decimal("1.700000")
 
 
 def test_calculate_cost_total_zero_components():
     """Test cost total with zero components."""
-    result = calculate_cost_total(Decimal("0"), Decimal("0"), Decimal("0"))
+    result = calculate_cost_total(_D0, _D0, _D0)
     assert result == Decimal("0.000000")
     
-    result = calculate_cost_total(Decimal("1"), Decimal("0"), Decimal("0"))
+    result = calculate_cost_total(_D1, _D0, _D0)
     assert result == Decimal("1.000000")
 
 
 def test_calculate_drawdown_basic():
     """Test basic drawdown calculation."""
-    result = calculate_drawdown(Decimal("1000"), Decimal("800"))
+    result = calculate_drawdown(_D1000, Decimal("800"))
     assert result == Decimal("20.0000")
 
 
 def test_calculate_drawdown_zero():
     """Test drawdown when equity equals max."""
-    result = calculate_drawdown(Decimal("1000"), Decimal("1000"))
+    result = calculate_drawdown(_D1000, _D1000)
     assert result == Decimal("0.0000")
 
 
 def test_calculate_drawdown_negative_max():
     """Test drawdown with zero or negative max equity."""
-    result = calculate_drawdown(Decimal("0"), Decimal("100"))
+    result = calculate_drawdown(_D0, _D100)
     assert result == Decimal("0.0000")
     
-    result = calculate_drawdown(Decimal("-100"), Decimal("100"))
+    result = calculate_drawdown(Decimal("-100"), _D100)
     assert result == Decimal("0.0000")
 
 
 def test_calculate_drawdown_above_max():
     """Test drawdown when equity exceeds max (should be 0)."""
-    result = calculate_drawdown(Decimal("1000"), Decimal("1200"))
+    result = calculate_drawdown(_D1000, Decimal("1200"))
     # Drawdown should be 0 when equity > max
     assert result == Decimal("-20.0000")  # Negative means above max
 
@@ -92,57 +127,57 @@ def test_calculate_drawdown_above_max():
 def test_apply_order_transaction_no_position():
     """Test ORDER transaction with no existing position."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     tx: TransactionInput = {
         "type": "ORDER",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0.5"),
-        "taxes": Decimal("0.2"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D1,
+        "fees": _FEES,
+        "taxes": _TAXES,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result = apply_transaction(account, None, tx)
     
     assert result["cash_after"] == account["cash"]  # Unchanged
-    assert result["position_qty_after"] == Decimal("0")
-    assert result["realized_pnl_delta"] == Decimal("0")
+    assert result["position_qty_after"] == _D0
+    assert result["realized_pnl_delta"] == _D0
     assert result["realized_pnl_cum_after"] == account["realized_pnl_cum"]
 
 
 def test_apply_order_transaction_with_position():
     """Test ORDER transaction with existing position."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("110"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "avg_cost": _D100,
+        "last_price": _D110,
+        "fx": _FX_1,
     }
     
     tx: TransactionInput = {
         "type": "ORDER",
         "side": "BUY",
-        "qty": Decimal("5"),
-        "price": Decimal("120"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D5,
+        "price": _D120,
+        "commission": _D1,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -152,59 +187,59 @@ def test_apply_order_transaction_with_position():
     assert result["position_qty_after"] == position["qty"]  # Unchanged
     assert result["position_avg_cost_after"] == position["avg_cost"]  # Unchanged
     assert result["last_price_after"] == tx["price"]  # Updated
-    assert result["realized_pnl_delta"] == Decimal("0")
+    assert result["realized_pnl_delta"] == _D0
 
 
 def test_apply_order_sl_transaction():
     """Test ORDER_SL transaction."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     tx: TransactionInput = {
         "type": "ORDER_SL",
         "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("90"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
-        "sl_price": Decimal("90"),
+        "qty": _D10,
+        "price": _D90,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
+        "sl_price": _D90,
     }
     
     result = apply_transaction(account, None, tx)
     assert result["cash_after"] == account["cash"]
-    assert result["position_qty_after"] == Decimal("0")
+    assert result["position_qty_after"] == _D0
 
 
 def test_apply_order_tp_transaction():
     """Test ORDER_TP transaction."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     tx: TransactionInput = {
         "type": "ORDER_TP",
         "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("110"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D110,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result = apply_transaction(account, None, tx)
     assert result["cash_after"] == account["cash"]
-    assert result["position_qty_after"] == Decimal("0")
+    assert result["position_qty_after"] == _D0
 
 
 # ============================================================================
@@ -212,213 +247,152 @@ def test_apply_order_tp_transaction():
 # ============================================================================
 
 
+@pytest.mark.parametrize(
+    ("position", "tx", "expected_qty", "expected_cash", "expected_avg_cost"),
+    [
+        pytest.param(
+            None,
+            fill_tx("FILL", "BUY", "10", "100", fx="1.5"),
+            _D10,
+            _D5000 - (_D10 * _D100 * _FX_1_5 + _D1),
+            (_D10 * _D100 * _FX_1_5 + _D1) / _D10,
+            id="entry_with_fx",
+        ),
+        pytest.param(
+            _position("10", "100", "110"),
+            fill_tx("FILL", "BUY", "5", "120", fees="0.5", taxes="0.2"),
+            _D15,
+            _D5000 - (_D5 * _D120 + _COST_TOTAL),
+            (_D10 * _D100 + _D5 * _D120 + _COST_TOTAL) / _D15,
+            id="add_to_position",
+        ),
+        pytest.param(
+            _position("10", "100", "100"),
+            fill_tx("FILL", "BUY", "5", "100", fx="1.5"),
+            _D15,
+            _D5000 - (_D5 * _D100 * _FX_1_5 + _D1),
+            (_D10 * _D100 + _D5 * _D100 * _FX_1_5 + _D1)
+            / _D15,
+            id="add_with_different_fx",
+        ),
+    ],
+)
+def test_apply_buy_fill(
+    position: PositionStateBefore | None,
+    tx: TransactionInput,
+    expected_qty: Decimal,
+    expected_cash: Decimal,
+    expected_avg_cost: Decimal,
+):
+    """Test BUY FILL entry/add: cash, quantity and cost-inclusive average cost."""
+    account: AccountStateBefore = {
+        "cash": _D5000,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
+    }
+
+    result = apply_transaction(account, position, tx)
+
+    assert abs(result["cash_after"] - expected_cash) < _CASH_TOLERANCE
+    assert result["position_qty_after"] == expected_qty
+    assert abs(result["position_avg_cost_after"] - expected_avg_cost) < _TOLERANCE
+    assert result["realized_pnl_delta"] == _D0
+
+
 def test_apply_buy_fill_entry():
     """Test BUY FILL that opens new position."""
     account: AccountStateBefore = {
-        "cash": Decimal("5000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D5000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     tx: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0.5"),
-        "taxes": Decimal("0.2"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D1,
+        "fees": _FEES,
+        "taxes": _TAXES,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result = apply_transaction(account, None, tx)
     
     # Cash should decrease by (qty * price * fx + costs)
-    expected_cash = Decimal("5000") - (Decimal("10") * Decimal("100") * Decimal("1.0") + Decimal("1.7"))
-    assert abs(result["cash_after"] - expected_cash) < Decimal("0.01")
+    expected_cash = _D5000 - (_D10 * _D100 * _FX_1 + _COST_TOTAL)
+    assert abs(result["cash_after"] - expected_cash) < _CASH_TOLERANCE
     
     # Position should be created
-    assert result["position_qty_after"] == Decimal("10")
+    assert result["position_qty_after"] == _D10
     
     # Average cost should include transaction costs
-    expected_avg_cost = (Decimal("10") * Decimal("100") * Decimal("1.0") + Decimal("1.7")) / Decimal("10")
-    assert abs(result["position_avg_cost_after"] - expected_avg_cost) < Decimal("0.000001")
+    expected_avg_cost = (_D10 * _D100 * _FX_1 + _COST_TOTAL) / _D10
+    assert abs(result["position_avg_cost_after"] - expected_avg_cost) < _TOLERANCE
     
     # BUY transactions have realized_pnl_delta = -cost_total (transaction costs reduce equity)
-    expected_cost_total = Decimal("1") + Decimal("0.5") + Decimal("0.2")  # commission + fees + taxes
-    assert abs(result["realized_pnl_delta"] - (-expected_cost_total)) < Decimal("0.000001")
-    assert abs(result["realized_pnl_cum_after"] - (account["realized_pnl_cum"] - expected_cost_total)) < Decimal("0.000001")
-
-
-def test_apply_buy_fill_entry_with_fx():
-    """Test BUY FILL entry with FX rate."""
-    account: AccountStateBefore = {
-        "cash": Decimal("5000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "FILL",
-        "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.5"),
-        "sl_price": None,
-    }
-    
-    result = apply_transaction(account, None, tx)
-    
-    # Cash should decrease by (qty * price * fx + costs)
-    expected_cash = Decimal("5000") - (Decimal("10") * Decimal("100") * Decimal("1.5") + Decimal("1"))
-    assert abs(result["cash_after"] - expected_cash) < Decimal("0.01")
-    
-    # Average cost should include FX and costs
-    expected_avg_cost = (Decimal("10") * Decimal("100") * Decimal("1.5") + Decimal("1")) / Decimal("10")
-    assert abs(result["position_avg_cost_after"] - expected_avg_cost) < Decimal("0.000001")
-
-
-def test_apply_buy_fill_add_to_position():
-    """Test BUY FILL that adds to existing position."""
-    account: AccountStateBefore = {
-        "cash": Decimal("5000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("110"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "FILL",
-        "side": "BUY",
-        "qty": Decimal("5"),
-        "price": Decimal("120"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0.5"),
-        "taxes": Decimal("0.2"),
-        "fx": Decimal("1.0"),
-        "sl_price": None,
-    }
-    
-    result = apply_transaction(account, position, tx)
-    
-    # Cash should decrease
-    expected_cash = Decimal("5000") - (Decimal("5") * Decimal("120") * Decimal("1.0") + Decimal("1.7"))
-    assert abs(result["cash_after"] - expected_cash) < Decimal("0.01")
-    
-    # Position quantity should increase
-    assert result["position_qty_after"] == Decimal("15")
-    
-    # Average cost should be recalculated
-    cost_before = Decimal("10") * Decimal("100")
-    cost_new = Decimal("5") * Decimal("120") + Decimal("1.7")
-    expected_avg_cost = (cost_before + cost_new) / Decimal("15")
-    assert abs(result["position_avg_cost_after"] - expected_avg_cost) < Decimal("0.000001")
-
-
-def test_apply_buy_fill_add_with_different_fx():
-    """Test BUY FILL add with different FX rate."""
-    account: AccountStateBefore = {
-        "cash": Decimal("5000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),  # In account currency
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "FILL",
-        "side": "BUY",
-        "qty": Decimal("5"),
-        "price": Decimal("100"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.5"),  # Different FX rate
-        "sl_price": None,
-    }
-    
-    result = apply_transaction(account, position, tx)
-    
-    # Average cost should account for different FX
-    cost_before = Decimal("10") * Decimal("100")  # 1000
-    cost_new = Decimal("5") * Decimal("100") * Decimal("1.5") + Decimal("1")  # 751
-    expected_avg_cost = (cost_before + cost_new) / Decimal("15")
-    assert abs(result["position_avg_cost_after"] - expected_avg_cost) < Decimal("0.000001")
+    expected_cost_total = _D1 + _FEES + _TAXES  # commission + fees + taxes
+    assert abs(result["realized_pnl_delta"] - (-expected_cost_total)) < _TOLERANCE
+    assert abs(result["realized_pnl_cum_after"] - (account["realized_pnl_cum"] - expected_cost_total)) < _TOLERANCE
 
 
 def test_apply_buy_fill_sl_entry():
     """Test BUY SL FILL entry."""
     account: AccountStateBefore = {
-        "cash": Decimal("5000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D5000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     tx: TransactionInput = {
         "type": "SL",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("90"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
-        "sl_price": Decimal("90"),
+        "qty": _D10,
+        "price": _D90,
+        "commission": _D1,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
+        "sl_price": _D90,
     }
     
     result = apply_transaction(account, None, tx)
-    assert result["position_qty_after"] == Decimal("10")
+    assert result["position_qty_after"] == _D10
     # BUY transactions have realized_pnl_delta = -cost_total (transaction costs reduce equity)
-    expected_cost_total = Decimal("1")  # commission
-    assert abs(result["realized_pnl_delta"] - (-expected_cost_total)) < Decimal("0.000001")
+    expected_cost_total = _D1  # commission
+    assert abs(result["realized_pnl_delta"] - (-expected_cost_total)) < _TOLERANCE
 
 
 def test_apply_buy_fill_tp_entry():
     """Test BUY TP FILL entry."""
     account: AccountStateBefore = {
-        "cash": Decimal("5000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D5000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     tx: TransactionInput = {
         "type": "TP",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("110"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D110,
+        "commission": _D1,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result = apply_transaction(account, None, tx)
-    assert result["position_qty_after"] == Decimal("10")
+    assert result["position_qty_after"] == _D10
     # BUY transactions have realized_pnl_delta = -cost_total (transaction costs reduce equity)
-    expected_cost_total = Decimal("1")  # commission
-    assert abs(result["realized_pnl_delta"] - (-expected_cost_total)) < Decimal("0.000001")
+    expected_cost_total = _D1  # commission
+    assert abs(result["realized_pnl_delta"] - (-expected_cost_total)) < _TOLERANCE
 
 
 # ============================================================================
@@ -429,182 +403,118 @@ def test_apply_buy_fill_tp_entry():
 def test_apply_sell_fill_partial_close():
     """Test SELL FILL that partially closes position."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "avg_cost": _D100,
+        "last_price": _D100,
+        "fx": _FX_1,
     }
     
     tx: TransactionInput = {
         "type": "FILL",
         "side": "SELL",
-        "qty": Decimal("5"),
-        "price": Decimal("110"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0.5"),
-        "taxes": Decimal("0.2"),
-        "fx": Decimal("1.0"),
+        "qty": _D5,
+        "price": _D110,
+        "commission": _D1,
+        "fees": _FEES,
+        "taxes": _TAXES,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result = apply_transaction(account, position, tx)
     
     # Cash should increase
-    expected_cash = Decimal("1000") + (Decimal("5") * Decimal("110") * Decimal("1.0") - Decimal("1.7"))
-    assert abs(result["cash_after"] - expected_cash) < Decimal("0.01")
+    expected_cash = _D1000 + (_D5 * _D110 * _FX_1 - _COST_TOTAL)
+    assert abs(result["cash_after"] - expected_cash) < _CASH_TOLERANCE
     
     # Position quantity should decrease
-    assert result["position_qty_after"] == Decimal("5")
+    assert result["position_qty_after"] == _D5
     
     # Average cost should remain unchanged
     assert result["position_avg_cost_after"] == position["avg_cost"]
     
     # Realized P&L should be calculated
-    pnl_gross = (Decimal("110") * Decimal("1.0") - Decimal("100")) * Decimal("5")
-    expected_realized = pnl_gross - Decimal("1.7")
-    assert abs(result["realized_pnl_delta"] - expected_realized) < Decimal("0.000001")
-    assert abs(result["realized_pnl_cum_after"] - expected_realized) < Decimal("0.000001")
-
-
-def test_apply_sell_fill_full_close():
-    """Test SELL FILL that fully closes position."""
+    pnl_gross = (_D110 * _FX_1 - _D100) * _D5
+    expected_realized = pnl_gross - _COST_TOTAL
+    assert abs(result["realized_pnl_delta"] - expected_realized) < _TOLERANCE
+    assert abs(result["realized_pnl_cum_after"] - expected_realized) < _TOLERANCE
+
+
+@pytest.mark.parametrize(
+    ("tx", "expected_realized"),
+    [
+        pytest.param(
+            fill_tx("FILL", "SELL", "10", "110", fees="0.5", taxes="0.2"),
+            (_D110 - _D100) * _D10 - _COST_TOTAL,
+            id="full_close",
+        ),
+        pytest.param(
+            fill_tx("FILL", "SELL", "10", "90", fees="0.5", taxes="0.2"),
+            (_D90 - _D100) * _D10 - _COST_TOTAL,
+            id="with_loss",
+        ),
+        pytest.param(
+            fill_tx("FILL", "SELL", "10", "100", fx="1.5"),
+            (_D100 * _FX_1_5 - _D100) * _D10 - _D1,
+            id="with_fx",
+        ),
+        pytest.param(
+            fill_tx("SL", "SELL", "10", "90"),
+            (_D90 - _D100) * _D10 - _D1,
+            id="sl",
+        ),
+        pytest.param(
+            fill_tx("TP", "SELL", "10", "110"),
+            (_D110 - _D100) * _D10 - _D1,
+            id="tp",
+        ),
+    ],
+)
+def test_apply_sell_fill_full_close(tx: TransactionInput, expected_realized: Decimal):
+    """Test SELL FILL/SL/TP that fully closes a position."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "FILL",
-        "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("110"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0.5"),
-        "taxes": Decimal("0.2"),
-        "fx": Decimal("1.0"),
-        "sl_price": None,
+        "cash": _D1000,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
-    
-    result = apply_transaction(account, position, tx)
-    
-    # Position should be removed
-    assert result["position_qty_after"] == Decimal("0")
-    assert result["position_removed"] is True
-    assert result["position_avg_cost_after"] == Decimal("0")
-    
-    # Realized P&L should be calculated
-    pnl_gross = (Decimal("110") * Decimal("1.0") - Decimal("100")) * Decimal("10")
-    expected_realized = pnl_gross - Decimal("1.7")
-    assert abs(result["realized_pnl_delta"] - expected_realized) < Decimal("0.000001")
+    position = _position("10", "100", "100")
 
-
-def test_apply_sell_fill_with_loss():
-    """Test SELL FILL that closes position at a loss."""
-    account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "FILL",
-        "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("90"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0.5"),
-        "taxes": Decimal("0.2"),
-        "fx": Decimal("1.0"),
-        "sl_price": None,
-    }
-    
     result = apply_transaction(account, position, tx)
-    
-    # Realized P&L should be negative
-    pnl_gross = (Decimal("90") * Decimal("1.0") - Decimal("100")) * Decimal("10")
-    expected_realized = pnl_gross - Decimal("1.7")
-    assert result["realized_pnl_delta"] < Decimal("0")
-    assert abs(result["realized_pnl_delta"] - expected_realized) < Decimal("0.000001")
 
+    # Position should be removed
+    assert result["position_qty_after"] == _D0
+    assert result["position_removed"] is True
+    assert result["position_avg_cost_after"] == _D0
 
-def test_apply_sell_fill_with_fx():
-    """Test SELL FILL with FX rate."""
-    account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),  # In account currency
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "FILL",
-        "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.5"),  # Different FX
-        "sl_price": None,
-    }
-    
-    result = apply_transaction(account, position, tx)
-    
-    # Realized P&L should account for FX
-    pnl_gross = (Decimal("100") * Decimal("1.5") - Decimal("100")) * Decimal("10")
-    expected_realized = pnl_gross - Decimal("1")
-    assert abs(result["realized_pnl_delta"] - expected_realized) < Decimal("0.000001")
+    # Realized P&L: (exit price in account currency - avg cost) * qty - costs
+    assert abs(result["realized_pnl_delta"] - expected_realized) < _TOLERANCE
 
 
 def test_apply_sell_fill_requires_position():
     """Test SELL FILL requires existing position."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     tx: TransactionInput = {
         "type": "FILL",
         "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -615,28 +525,28 @@ def test_apply_sell_fill_requires_position():
 def test_apply_sell_fill_insufficient_position():
     """Test SELL FILL with insufficient position quantity."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     position: PositionStateBefore = {
-        "qty": Decimal("5"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
+        "qty": _D5,
+        "avg_cost": _D100,
+        "last_price": _D100,
+        "fx": _FX_1,
     }
     
     tx: TransactionInput = {
         "type": "FILL",
         "side": "SELL",
-        "qty": Decimal("10"),  # More than position
-        "price": Decimal("100"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,  # More than position
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -644,72 +554,6 @@ def test_apply_sell_fill_insufficient_position():
         apply_transaction(account, position, tx)
 
 
-def test_apply_sell_fill_sl():
-    """Test SELL SL FILL."""
-    account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "SL",
-        "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("90"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
-        "sl_price": Decimal("90"),
-    }
-    
-    result = apply_transaction(account, position, tx)
-    assert result["position_qty_after"] == Decimal("0")
-    assert result["position_removed"] is True
-
-
-def test_apply_sell_fill_tp():
-    """Test SELL TP FILL."""
-    account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
-    }
-    
-    position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
-    }
-    
-    tx: TransactionInput = {
-        "type": "TP",
-        "side": "SELL",
-        "qty": Decimal("10"),
-        "price": Decimal("110"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
-        "sl_price": None,
-    }
-    
-    result = apply_transaction(account, position, tx)
-    assert result["position_qty_after"] == Decimal("0")
-    assert result["position_removed"] is True
-
-
 # ============================================================================
 # MARK_TO_MARKET Transaction Tests
 # ============================================================================
@@ -718,28 +562,28 @@ def test_apply_sell_fill_tp():
 def test_apply_mark_to_market_basic():
     """Test MARK_TO_MARKET transaction."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
+        "cash": _D1000,
         "realized_pnl_cum": Decimal("50"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "avg_cost": _D100,
+        "last_price": _D100,
+        "fx": _FX_1,
     }
     
     tx: TransactionInput = {
         "type": "MARK_TO_MARKET",
         "side": "BUY",  # Side doesn't matter for MTM
-        "qty": Decimal("10"),
-        "price": Decimal("110"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D110,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -756,62 +600,64 @@ def test_apply_mark_to_market_basic():
     assert result["last_price_after"] == tx["price"]
     
     # Realized P&L unchanged
-    assert result["realized_pnl_delta"] == Decimal("0")
+    assert result["realized_pnl_delta"] == _D0
     assert result["realized_pnl_cum_after"] == account["realized_pnl_cum"]
 
 
 def test_apply_mark_to_market_with_fx():
     """Test MARK_TO_MARKET with FX rate change."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     position: PositionStateBefore = {
-        "qty": Decimal("10"),
-        "avg_cost": Decimal("100"),
-        "last_price": Decimal("100"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "avg_cost": _D100,
+        "last_price": _D100,
+        "fx": _FX_1,
     }
     
     tx: TransactionInput = {
         "type": "MARK_TO_MARKET",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.5"),  # FX changed
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1_5,  # FX changed
         "sl_price": None,
     }
     
     result = apply_transaction(account, position, tx)
     
     assert result["fx_after"] == tx["fx"]
-    assert result["position_notional_after"] == Decimal("10") * Decimal("100") * Decimal("1.5")
+    assert result["position_notional_after"] == _D10 * _D100 * _FX_1_5
+    # Zero costs keep the same 6dp representation as calculate_cost_total
+    assert str(result["cost_total"]) == str(calculate_cost_total(_D0, _D0, _D0))
 
 
 def test_apply_mark_to_market_requires_position():
     """Test MARK_TO_MARKET requires existing position."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("5000"),
-        "initial_equity": Decimal("5000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D5000,
+        "initial_equity": _D5000,
     }
     
     tx: TransactionInput = {
         "type": "MARK_TO_MARKET",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("110"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D110,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -827,21 +673,21 @@ def test_apply_mark_to_market_requires_position():
 def test_apply_transaction_very_small_quantities():
     """Test transaction with very small quantities."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     tx: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
         "qty": Decimal("0.000001"),
-        "price": Decimal("100"),
+        "price": _D100,
         "commission": Decimal("0.000001"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -853,7 +699,7 @@ def test_apply_transaction_very_large_quantities():
     """Test transaction with very large quantities."""
     account: AccountStateBefore = {
         "cash": Decimal("1000000000"),
-        "realized_pnl_cum": Decimal("0"),
+        "realized_pnl_cum": _D0,
         "max_equity_to_date": Decimal("1000000000"),
         "initial_equity": Decimal("1000000000"),
     }
@@ -862,11 +708,11 @@ def test_apply_transaction_very_large_quantities():
         "type": "FILL",
         "side": "BUY",
         "qty": Decimal("1000000"),
-        "price": Decimal("1000"),
-        "commission": Decimal("1000"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "price": _D1000,
+        "commission": _D1000,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -877,46 +723,48 @@ def test_apply_transaction_very_large_quantities():
 def test_apply_transaction_very_high_precision_prices():
     """Test transaction with very high precision prices."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     tx: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
-        "qty": Decimal("10"),
+        "qty": _D10,
         "price": Decimal("123.4567890123456789012345678"),
         "commission": Decimal("0.000001"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result = apply_transaction(account, None, tx)
     assert result["last_price_after"] == tx["price"]
+    # Full 28-digit precision is kept (no fixed-point truncation of prices)
+    assert result["position_avg_cost_after"] == Decimal("123.4567891123456789012345678")
 
 
 def test_apply_transaction_fx_rate_edge_cases():
     """Test transactions with FX rate edge cases."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     # Very small FX rate
     tx1: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
         "fx": Decimal("0.000001"),
         "sl_price": None,
     }
@@ -927,7 +775,7 @@ def test_apply_transaction_fx_rate_edge_cases():
     # Very large FX rate
     account2: AccountStateBefore = {
         "cash": Decimal("1000000"),
-        "realized_pnl_cum": Decimal("0"),
+        "realized_pnl_cum": _D0,
         "max_equity_to_date": Decimal("1000000"),
         "initial_equity": Decimal("1000000"),
     }
@@ -935,11 +783,11 @@ def test_apply_transaction_fx_rate_edge_cases():
     tx2: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
         "fx": Decimal("1000.0"),
         "sl_price": None,
     }
@@ -951,22 +799,22 @@ def test_apply_transaction_fx_rate_edge_cases():
 def test_apply_transaction_multiple_adds_average_cost():
     """Test average cost calculation with multiple adds."""
     account: AccountStateBefore = {
-        "cash": Decimal("10000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("10000"),
-        "initial_equity": Decimal("10000"),
+        "cash": _D10000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D10000,
+        "initial_equity": _D10000,
     }
     
     # First entry
     tx1: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D1,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
@@ -977,8 +825,8 @@ def test_apply_transaction_multiple_adds_average_cost():
     account2: AccountStateBefore = {
         "cash": result1["cash_after"],
         "realized_pnl_cum": result1["realized_pnl_cum_after"],
-        "max_equity_to_date": Decimal("10000"),
-        "initial_equity": Decimal("10000"),
+        "max_equity_to_date": _D10000,
+        "initial_equity": _D10000,
     }
     
     position1: PositionStateBefore = {
@@ -991,45 +839,99 @@ def test_apply_transaction_multiple_adds_average_cost():
     tx2: TransactionInput = {
         "type": "FILL",
         "side": "BUY",
-        "qty": Decimal("5"),
-        "price": Decimal("120"),
-        "commission": Decimal("1"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D5,
+        "price": _D120,
+        "commission": _D1,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     result2 = apply_transaction(account2, position1, tx2)
     
     # Average cost should be weighted
-    cost_before = Decimal("10") * avg_cost1
-    cost_new = Decimal("5") * Decimal("120") + Decimal("1")
-    expected_avg_cost = (cost_before + cost_new) / Decimal("15")
-    assert abs(result2["position_avg_cost_after"] - expected_avg_cost) < Decimal("0.000001")
+    cost_before = _D10 * avg_cost1
+    cost_new = _D5 * _D120 + _D1
+    expected_avg_cost = (cost_before + cost_new) / _D15
+    assert abs(result2["position_avg_cost_after"] - expected_avg_cost) < _TOLERANCE
+
+
+def test_apply_transactions_threads_state_between_transactions():
+    """Test sequential replay feeds each result into the next transaction."""
+    account: AccountStateBefore = {
+        "cash": _D10000,
+        "max_equity_to_date": _D10000,
+        "initial_equity": _D10000,
+    }
+
+    txs = [
+        fill_tx("FILL", "BUY", "10", "100"),
+        fill_tx("FILL", "BUY", "5", "120"),
+        fill_tx("FILL", "SELL", "15", "130"),
+    ]
+
+    results = apply_transactions(account, None, txs)
+
+    assert account["cash"] == _D10000
+    first = apply_transaction(account, None, txs[0])
+    assert results[0] == first
+    assert results[1]["position_qty_after"] == _D15
+    assert results[1]["position_avg_cost_after"] == (Decimal("1001") + Decimal("601")) / _D15
+    assert results[2]["position_removed"] is True
+    assert results[2]["cash_after"] == _D10000 - Decimal("1001") - Decimal("601") + Decimal("1949")
 
 
 def test_apply_transaction_adjustment_not_implemented():
     """Test that ADJUSTMENT transaction type raises error."""
     account: AccountStateBefore = {
-        "cash": Decimal("1000"),
-        "realized_pnl_cum": Decimal("0"),
-        "max_equity_to_date": Decimal("1000"),
-        "initial_equity": Decimal("1000"),
+        "cash": _D1000,
+        "realized_pnl_cum": _D0,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
     }
     
     tx: TransactionInput = {
         "type": "ADJUSTMENT",
         "side": "BUY",
-        "qty": Decimal("10"),
-        "price": Decimal("100"),
-        "commission": Decimal("0"),
-        "fees": Decimal("0"),
-        "taxes": Decimal("0"),
-        "fx": Decimal("1.0"),
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
         "sl_price": None,
     }
     
     with pytest.raises(ValueError, match="not yet implemented"):
         apply_transaction(account, None, tx)
 
+
+def test_apply_transaction_unknown_side_rejected():
+    """Test that a fill with an unknown side is rejected instead of treated as SELL."""
+    account: AccountStateBefore = {
+        "cash": _D1000,
+        "max_equity_to_date": _D1000,
+        "initial_equity": _D1000,
+    }
+    position: PositionStateBefore = {
+        "qty": _D10,
+        "avg_cost": _D100,
+        "last_price": _D100,
+        "fx": _FX_1,
+    }
+
+    tx: TransactionInput = {
+        "type": "FILL",
+        "side": "HOLD",
+        "qty": _D10,
+        "price": _D100,
+        "commission": _D0,
+        "fees": _D0,
+        "taxes": _D0,
+        "fx": _FX_1,
+        "sl_price": None,
+    }
+
+    with pytest.raises(ValueError, match="Unsupported side 'HOLD' for FILL"):
+        apply_transaction(account, position, tx)
@@ -2,6 +2,8 @@
 
 from decimal import Decimal
 
+import pytest
+
 from aletrader.finance.accounting.domain.calculations import (
     calculate_cash_from_initial_and_transactions,
 )
@@ -10,6 +12,8 @@ from aletrader.finance.accounting.domain.calculations import (
 class MockTransaction:
     """Mock transaction for testing."""
 
+    __slots__ = ("type", "side", "qty", "price", "commission", "fees", "taxes", "amount")
+
     def __init__(
         self,
         type: str,
@@ -110,6 +114,30 @@ def test_cash_with_multiple_transactions() -> None:
     assert result == Decimal("10098")
 
 
+def test_cash_accepts_tuple_of_transactions() -> None:
+    """Test that any sequence of transactions is accepted, not only lists."""
+    transactions = (
+        MockTransaction(type="DEPOSIT", amount=Decimal("500")),
+        MockTransaction(type="WITHDRAWAL", amount=Decimal("200")),
+    )
+    result = calculate_cash_from_initial_and_transactions(Decimal("10000"), transactions)
+    assert result == Decimal("10300")
+
+
+def test_cash_with_deposit_missing_amount_rejected() -> None:
+    """Test that a DEPOSIT without amount is rejected."""
+    tx = MockTransaction(type="DEPOSIT")
+    with pytest.raises(ValueError, match="DEPOSIT transaction requires amount"):
+        calculate_cash_from_initial_and_transactions(Decimal("10000"), [tx])
+
+
+def test_cash_with_fill_missing_price_rejected() -> None:
+    """Test that a FILL without price is rejected."""
+    tx = MockTransaction(type="FILL", side="BUY", qty=Decimal("10"))
+    with pytest.raises(ValueError, match="FILL transaction requires qty and price"):
+        calculate_cash_from_initial_and_transactions(Decimal("10000"), [tx])
+
+
 def test_cash_with_sl_transaction() -> None:
     """Test cash increases with SL (stop loss)."""
     tx = MockTransaction(
@@ -142,6 +170,24 @@ def test_cash_with_tp_transaction() -> None:
     assert result == Decimal("11198.5")
 
 
+@pytest.mark.parametrize("tx_type", ["SL", "TP"])
+@pytest.mark.parametrize("side", [None, "", "sell", "EXIT", "LONG"])
+def test_cash_with_exit_ignores_recorded_side(tx_type: str, side: str | None) -> None:
+    """Test SL/TP exits credit cash whatever side string was recorded."""
+    tx = MockTransaction(
+        type=tx_type,
+        side=side,
+        qty=Decimal("10"),
+        price=Decimal("1"),
+        commission=Decimal("0"),
+        fees=Decimal("0"),
+        taxes=Decimal("0"),
+    )
+    result = calculate_cash_from_initial_and_transactions(Decimal("100"), [tx])
+    # 100 + 10*1 = 110
+    assert result == Decimal("110")
+
+
 def test_cash_with_none_costs() -> None:
     """Test that None costs are treated as zero."""
     tx = MockTransaction(
@@ -8,7 +8,7 @@ from decimal import Decimal
 from aletrader.finance.accounting.interfaces import AccountFinancialCalculator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionStub:
     """Simple position stub for aggregation tests."""
 
@@ -18,7 +18,7 @@ class PositionStub:
     unrealized_pnl: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApprovedOrderStub:
     """Simple approved order stub for aggregation tests."""
 
@@ -90,6 +90,29 @@ def test_aggregate_unrealized_pnl_sums_values() -> None:
     assert total == Decimal("4.00")
 
 
+def test_aggregate_positions_skip_flat_positions_and_empty_input() -> None:
+    positions = [
+        PositionStub(
+            notional=Decimal("50.00"),
+            qty=Decimal("0"),
+            avg_cost=Decimal("10.00"),
+            unrealized_pnl=Decimal("3.00"),
+        ),
+        PositionStub(
+            notional=Decimal("20.00"),
+            qty=Decimal("2"),
+            avg_cost=Decimal("9.00"),
+            unrealized_pnl=Decimal("2.00"),
+        ),
+    ]
+
+    assert AccountFinancialCalculator.aggregate_positions_value(positions) == Decimal("20.00")
+    assert AccountFinancialCalculator.aggregate_positions_cost(positions) == Decimal("18.00")
+    assert AccountFinancialCalculator.aggregate_unrealized_pnl(positions) == Decimal("2.00")
+    assert AccountFinancialCalculator.aggregate_unrealized_pnl([]) == Decimal("0")
+    assert AccountFinancialCalculator.aggregate_order_risk([]) == (Decimal("0"), Decimal("0"))
+
+
 def test_aggregate_order_risk_respects_filters() -> None:
     orders = [
         ApprovedOrderStub(
@@ -1,12 +1,15 @@
+import json
 from dataclasses import dataclass
 from decimal import Decimal
 
 from aletrader.finance.accounting.domain.position_maintenance import (
     calculate_avg_entry_price_and_fx_from_transactions,
+    reconstruct_position_columns_from_transactions,
+    reconstruct_positions_from_transactions,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tx:
     side: str
     qty: Decimal
@@ -107,3 +110,112 @@ def test_avg_entry_price_and_fx_from_transactions_closed_position() -> None:
     ]
 
     assert calculate_avg_entry_price_and_fx_from_transactions(transactions) is None
+
+
+@dataclass(frozen=True, slots=True)
+class PositionTx:
+    symbol: str
+    timestamp: str
+    type: str
+    side: str
+    qty: Decimal
+    price: Decimal
+    fx_rate_used: Decimal
+    commission: Decimal
+    fees: Decimal
+    taxes: Decimal
+    position_qty_after: Decimal
+    position_avg_cost_after: Decimal
+
+
+def _position_tx(
+    symbol: str,
+    timestamp: str,
+    side: str,
+    qty_after: Decimal,
+    avg_cost_after: Decimal,
+) -> PositionTx:
+    return PositionTx(
+        symbol=symbol,
+        timestamp=timestamp,
+        type="FILL",
+        side=side,
+        qty=Decimal("5"),
+        price=Decimal("100"),
+        fx_rate_used=Decimal("1.0"),
+        commission=Decimal("0"),
+        fees=Decimal("0"),
+        taxes=Decimal("0"),
+        position_qty_after=qty_after,
+        position_avg_cost_after=avg_cost_after,
+    )
+
+
+_RECONSTRUCTION_TXS = [
+    _position_tx("AAPL", "2025-01-01T10:00:00", "BUY", Decimal("10"), Decimal("100")),
+    _position_tx("AAPL", "2025-01-02T10:00:00", "SELL", Decimal("5"), Decimal("100")),
+    _position_tx("MSFT", "2025-01-01T10:00:00", "BUY", Decimal("5"), Decimal("100")),
+    _position_tx("MSFT", "2025-01-03T10:00:00", "SELL", Decimal("0"), Decimal("0")),
+]
+_MARKET_PRICES = {"AAPL": Decimal("110")}
+_FX_RATES = {"AAPL": Decimal("1.5")}
+_AAPL_POSITION = {
+    "symbol": "AAPL",
+    "qty": Decimal("5"),
+    "avg_cost": Decimal("100"),
+    "last_price": Decimal("110"),
+    "fx": Decimal("1.5"),
+    "notional": Decimal("825.0"),
+    "unrealized_pnl": Decimal("325.000000"),
+}
+
+
+def test_reconstruct_positions_returns_list_of_dicts() -> None:
+    positions = reconstruct_positions_from_transactions(
+        _RECONSTRUCTION_TXS, _MARKET_PRICES, _FX_RATES
+    )
+
+    assert positions == [_AAPL_POSITION]
+
+
+def test_reconstruct_positions_rows_are_mutable() -> None:
+    positions = reconstruct_positions_from_transactions(
+        _RECONSTRUCTION_TXS, _MARKET_PRICES, _FX_RATES
+    )
+
+    positions[0]["qty"] = Decimal("7")
+
+    assert positions[0]["qty"] == Decimal("7")
+
+
+def test_reconstruct_positions_serializes_as_json_list() -> None:
+    positions = reconstruct_positions_from_transactions(
+        _RECONSTRUCTION_TXS, _MARKET_PRICES, _FX_RATES
+    )
+
+    assert json.loads(json.dumps(positions, default=str)) == [
+        {key: str(value) for key, value in _AAPL_POSITION.items()}
+    ]
+
+
+def test_reconstruct_position_columns_match_rows() -> None:
+    columns = reconstruct_position_columns_from_transactions(
+        _RECONSTRUCTION_TXS, _MARKET_PRICES, _FX_RATES
+    )
+
+    assert len(columns) == 1
+    assert columns.symbol == ("AAPL",)
+    assert columns.qty == (Decimal("5"),)
+    assert columns.avg_cost == (Decimal("100"),)
+    assert columns.last_price == (Decimal("110"),)
+    assert columns.fx == (Decimal("1.5"),)
+    assert columns.notional == (Decimal("825.0"),)
+    assert columns.unrealized_pnl == (Decimal("325.000000"),)
+
+
+def test_reconstruct_position_columns_empty() -> None:
+    columns = reconstruct_position_columns_from_transactions([], {}, {})
+
+    assert len(columns) == 0
+    assert columns.symbol == ()
+    assert columns.unrealized_pnl == ()
@@ -0,0 +1,197 @@
+"""
+Test realized P&L derivation from raw transaction history.
+
+Tests the calculation of realized P&L from ledger transactions
+without relying on stored realized_pnl_delta (balance sheet approach).
+"""
+
+from dataclasses import dataclass, replace
+from decimal import Decimal
+
+import pytest
+
+from aletrader.finance.accounting.domain.aggregations import (
+    calculate_realized_pnl_from_transaction_history,
+)
+from transaction_builders import fill_tx
+
+
+@dataclass(frozen=True, slots=True)
+class MockTransaction:
+    """Mock transaction for testing."""
+    symbol: str
+    side: str  # BUY, SELL
+    type: str  # FILL, EXIT, SL, TP
+    qty: Decimal
+    price: Decimal
+    commission: Decimal
+    fees: Decimal
+    taxes: Decimal
+    fx: Decimal | None
+    sl_price: Decimal | None
+
+
+def _tx(
+    tx_type: str,
+    side: str,
+    qty: str,
+    price: str,
+    fx: str = "1.0",
+    commission: str = "1",
+    fees: str = "0",
+    taxes: str = "0",
+    symbol: str = "AAPL",
+) -> MockTransaction:
+    """Build a ledger row for one symbol from the shared fill builder."""
+    return MockTransaction(
+        symbol=symbol,
+        **fill_tx(tx_type, side, qty, price, fx, commission, fees, taxes),
+    )
+
+
+_BUY_100_AT_10 = _tx("FILL", "BUY", "100", "10.00", commission="5.00")
+
+
+@pytest.mark.parametrize(
+    ("transactions", "expected"),
+    [
+        # (12.00 - 10.05) * 100 - 5.00 = 195 - 5 = 190
+        pytest.param(
+            [_BUY_100_AT_10, _tx("EXIT", "SELL", "100", "12.00", commission="5.00")],
+            Decimal("190.00"),
+            id="simple_full_exit",
+        ),
+        # Exit 1: (11.00 - 10.05) * 60 - 3.00 = 54.00
+        # Exit 2: (12.00 - 10.05) * 40 - 2.00 = 76.00
+        pytest.param(
+            [
+                _BUY_100_AT_10,
+                _tx("EXIT", "SELL", "60", "11.00", commission="3.00"),
+                _tx("EXIT", "SELL", "40", "12.00", commission="2.00"),
+            ],
+            Decimal("130.00"),
+            id="partial_exit",
+        ),
+        # Cost: 1,005.00 + 553.00 = 1,558.00; exit: 150 * 12.00 - 7.00 = 1,793.00
+        pytest.param(
+            [
+                _BUY_100_AT_10,
+                _tx("FILL", "BUY", "50", "11.00", commission="3.00"),
+                _tx("EXIT", "SELL", "150", "12.00", commission="7.00"),
+            ],
+            Decimal("235.00"),
+            id="add_to_position",
+        ),
+        # (9.00 - 10.05) * 100 - 5.00 = -105.00 - 5.00
+        pytest.param(
+            [_BUY_100_AT_10, _tx("SL", "SELL", "100", "9.00", commission="5.00")],
+            Decimal("-110.00"),
+            id="stop_loss",
+        ),
+        # (15.00 - 10.05) * 100 - 5.00 = 495.00 - 5.00
+        pytest.param(
+            [_BUY_100_AT_10, _tx("TP", "SELL", "100", "15.00", commission="5.00")],
+            Decimal("490.00"),
+            id="take_profit",
+        ),
+        # AAPL: (12.00 - 10.05) * 100 - 5.00 = 190.00
+        # MSFT: (22.00 - 20.10) * 50 - 5.00 = 90.00
+        pytest.param(
+            [
+                _BUY_100_AT_10,
+                _tx("EXIT", "SELL", "100", "12.00", commission="5.00"),
+                _tx("FILL", "BUY", "50", "20.00", commission="5.00", symbol="MSFT"),
+                _tx("EXIT", "SELL", "50", "22.00", commission="5.00", symbol="MSFT"),
+            ],
+            Decimal("280.00"),
+            id="multiple_symbols",
+        ),
+        # Entry cost: 1,006.50; exit proceeds: 1,200.00 - 6.50 = 1,193.50
+        pytest.param(
+            [
+                _tx("FILL", "BUY", "100", "10.00", commission="5.00", fees="1.00", taxes="0.50"),
+                _tx("EXIT", "SELL", "100", "12.00", commission="5.00", fees="1.00", taxes="0.50"),
+            ],
+            Decimal("187.00"),
+            id="fees_and_taxes",
+        ),
+        # Rows that are neither BUY nor SELL neither add nor consume lots:
+        # (12.00 - 10.05) * 100 - 5.00 = 190.00, as in simple_full_exit
+        pytest.param(
+            [
+                _BUY_100_AT_10,
+                _tx("DEPOSIT", "", "100", "1.00", commission="0"),
+                _tx("ADJUSTMENT", "HOLD", "50", "10.00", commission="1.00"),
+                _tx("EXIT", "SELL", "100", "12.00", commission="5.00"),
+            ],
+            Decimal("190.00"),
+            id="non_trade_rows_skipped",
+        ),
+        pytest.param([_BUY_100_AT_10], Decimal("0.00"), id="no_exits"),
+        pytest.param([], Decimal("0.00"), id="empty_transactions"),
+        # Entry: 100 * 10.00 * 0.8 + 5.00 = 805.00
+        # Exit: 100 * 12.00 * 0.75 - 5.00 = 895.00
+        pytest.param(
+            [
+                _tx("FILL", "BUY", "100", "10.00", commission="5.00", fx="0.8"),
+                _tx("EXIT", "SELL", "100", "12.00", commission="5.00", fx="0.75"),
+            ],
+            Decimal("90.00"),
+            id="fx_conversion",
+        ),
+        # fx=None is base currency: (12.00 - 10.05) * 100 - 5.00 = 190.00
+        pytest.param(
+            [
+                replace(_tx("FILL", "BUY", "100", "10.00", commission="5.00"), fx=None),
+                replace(_tx("EXIT", "SELL", "100", "12.00", commission="5.00"), fx=None),
+            ],
+            Decimal("190.00"),
+            id="fx_none",
+        ),
+    ],
+)
+def test_realized_pnl_from_transaction_history(
+    transactions: list[MockTransaction], expected: Decimal
+) -> None:
+    """Test realized P&L derived from FIFO cost basis of raw transactions."""
+    realized_pnl = calculate_realized_pnl_from_transaction_history(transactions)
+
+    assert realized_pnl == expected, f"Expected {expected}, got {realized_pnl}"
+
+
+@dataclass(frozen=True, slots=True)
+class MockTransactionWithoutFx:
+    """Mock transaction with no fx attribute at all."""
+    symbol: str
+    side: str
+    type: str
+    qty: Decimal
+    price: Decimal
+    commission: Decimal
+    fees: Decimal
+    taxes: Decimal
+
+
+def test_realized_pnl_without_fx_attribute_uses_base_currency() -> None:
+    """Test that transactions lacking an fx attribute are treated as base currency."""
+    transactions = [
+        MockTransactionWithoutFx(
+            symbol="AAPL",
+            side=side,
+            type=tx_type,
+            qty=Decimal("100"),
+            price=Decimal(price),
+            commission=Decimal("5.00"),
+            fees=Decimal("0"),
+            taxes=Decimal("0"),
+        )
+        for side, tx_type, price in (("BUY", "FILL", "10.00"), ("SELL", "EXIT", "12.00"))
+    ]
+
+    # fx is deliberately absent, so these rows only satisfy the protocol at runtime
+    realized_pnl = calculate_realized_pnl_from_transaction_history(
+        transactions  # type: ignore[arg-type]
+    )
+
+    # (12.00 - 10.05) * 100 - 5.00 = 190.00
+    assert realized_pnl == Decimal("190.00")
@@ -10,6 +10,8 @@ from aletrader.finance.accounting.domain.aggregations import (
 class MockLedgerTransaction:
     """Mock ledger transaction for testing."""
 
+    __slots__ = ("side", "realized_pnl_delta")
+
     def __init__(self, side: str, realized_pnl_delta: Decimal | None):
         self.side = side
         self.realized_pnl_delta = realized_pnl_delta
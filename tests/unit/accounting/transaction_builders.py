@@ -0,0 +1,29 @@
+"""Shared transaction builders for accounting unit tests."""
+
+from decimal import Decimal
+
+from aletrader.finance.accounting.domain.transactions import TransactionInput
+
+
+def fill_tx(
+    tx_type: str,
+    side: str,
+    qty: str,
+    price: str,
+    fx: str = "1.0",
+    commission: str = "1",
+    fees: str = "0",
+    taxes: str = "0",
+) -> TransactionInput:
+    """Build a fill transaction input from string amounts."""
+    return {
+        "type": tx_type,
+        "side": side,
+        "qty": Decimal(qty),
+        "price": Decimal(price),
+        "commission": Decimal(commission),
+        "fees": Decimal(fees),
+        "taxes": Decimal(taxes),
+        "fx": Decimal(fx),
+        "sl_price": None,
+    }